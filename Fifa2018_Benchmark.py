@@ -0,0 +1,648 @@
+# Benchmark the dashboard callbacks on synthetic datasets of growing size.
+#
+#     python Fifa2018_Benchmark.py --sizes 10000 100000 1000000
+#     python Fifa2018_Benchmark.py --compare benchmark_results.json
+#
+# Datasets are generated with Fifa2018_Synthetic_Data.py into --data-dir (and
+# reused on later runs). Every callback, and every figure built by the main
+# dashboard callbacks, is timed on the largest, a mid-sized and a small nation
+# with the figure caches bypassed. Results are written as JSON so runs can be
+# compared; --compare reports stages that got slower than --threshold.
+#
+# Each figure is also rebuilt with plotly express / graph_objects, as the
+# dashboard did before its dict figure builders, to check that both produce
+# the same figure and to time them against each other.
+#
+# Finally every callback response is serialized as Dash sends it, to report
+# its JSON size before and after compression and the time to encode it.
+import argparse
+import base64
+import datetime
+import importlib
+import json
+import math
+import os
+import platform
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+
+from Fifa2018_Synthetic_Data import generate_dataset
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def get_dataset(data_dir, rows):
+    """Return the path of a synthetic dataset, generating it if needed."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"fifa_synthetic_{rows}.csv")
+    if not os.path.exists(path):
+        generate_dataset(rows).to_csv(path, index=False)
+    return path
+
+
+def time_call(func, repeat):
+    """Run ``func`` ``repeat`` times and summarize the wall times in ms."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(times), 3),
+        "min_ms": round(min(times), 3),
+        "runs": repeat,
+    }
+
+
+def pick_nations(data):
+    """Return the largest, a mid-sized and a small nationality."""
+    sizes = sorted(
+        ((size, nat) for nat, size in data.nation_sizes.items()), reverse=True
+    )
+    picks = [sizes[0], sizes[len(sizes) // 2], sizes[-1]]
+    return {"large": picks[0][1], "medium": picks[1][1], "small": picks[2][1]}
+
+
+def get_stages(dash, data, nationality, skill):
+    """Return the callables to time for one nationality."""
+    filtered_df = data.nation_df(nationality)
+    names = filtered_df["Name"]
+    player1 = dash.player_key(nationality, names.iloc[0]) if len(names) else None
+    player2 = dash.player_key(nationality, names.iloc[1]) if len(names) > 1 else player1
+    search_text = names.iloc[0][:3] if len(names) else ""
+    return {
+        "nation_dashboard": lambda: dash.build_nation_dashboard(data, nationality),
+        "nation_dashboard.position_pie": lambda: dash.make_position_pie(
+            data, nationality
+        ),
+        "nation_dashboard.age_histogram": lambda: dash.make_age_histogram(
+            filtered_df, nationality
+        ),
+        "nation_dashboard.potential_age_scatter": lambda: (
+            dash.make_potential_age_scatter(filtered_df, nationality)
+        ),
+        "nation_dashboard.correlation_heatmap": lambda: (
+            dash.make_correlation_heatmap(data, nationality)
+        ),
+        "skill_dashboard": lambda: dash.build_skill_dashboard(data, nationality, skill),
+        "players_table": lambda: dash.query_players_table(
+            data, nationality, skill, 0, 10, [], ""
+        ),
+        "players_table.sorted_filtered": lambda: dash.query_players_table(
+            data,
+            nationality,
+            skill,
+            0,
+            10,
+            [{"column_id": "Age", "direction": "asc"}],
+            "{Overall} s> 60 && {Club} icontains 1",
+        ),
+        "radar_chart": lambda: dash.update_radar_chart(data, player1, player2),
+        "player_search": lambda: dash.update_player_options(data, search_text, player1),
+        "club_chart": lambda: dash.update_club_chart(data, "Overall", nationality),
+        "overall_chart": lambda: dash.update_overall_chart(data, skill),
+    }
+
+
+def run_size(dash, path, repeat, skill):
+    """Benchmark loading and every callback stage for one dataset.
+
+    Returns the timings and the prepared data.
+    """
+    results = {}
+    results["load_csv"] = time_call(lambda: dash.load_csv_dataset(path), 1)
+    raw = pd.read_csv(path)
+    results["parse_ratings"] = time_call(
+        lambda: dash.coerce_numeric_columns(raw.copy()), 1
+    )
+    frame = dash.load_csv_dataset(path)
+    results["prepare"] = time_call(lambda: dash.DashboardData(frame), 1)
+    results["ingest_streaming"] = time_call(
+        lambda: dash.PartitionedDashboardData(path, 100_000), 1
+    )
+
+    data = dash.DashboardData(frame)
+    for size_name, nationality in pick_nations(data).items():
+        for stage, func in get_stages(dash, data, nationality, skill).items():
+            results[f"{stage}[{size_name}]"] = time_call(func, repeat)
+    return results, data
+
+
+STYLE = dict(
+    plot_bgcolor="white",
+    paper_bgcolor="white",
+    margin=dict(l=20, r=20, t=60, b=20),
+    height=450,
+)
+
+
+def reference_top_players_bar(filtered_df, nationality, skill):
+    """Top players bar built with plotly express."""
+    top_players = filtered_df.sort_values(
+        by=skill, ascending=False, kind="stable"
+    ).head(10)
+    fig = px.bar(
+        top_players,
+        x="Name",
+        y=skill,
+        color="Club",
+        title=f"Top 10 Players by {skill} in {nationality}",
+        color_discrete_sequence=px.colors.qualitative.Set3,
+    )
+    fig.update_layout(
+        xaxis=dict(title="Player Name", tickangle=-45, tickfont=dict(size=10)),
+        yaxis=dict(title=f"{skill} Rating"),
+        legend_title="Club",
+        **STYLE,
+    )
+    return fig
+
+
+def reference_position_pie(data, nationality):
+    """Position pie built with plotly express."""
+    counts = data.position_counts.loc[nationality]
+    counts = counts[counts > 0].sort_values(ascending=False, kind="stable")
+    fig = px.pie(
+        pd.DataFrame({"Position": counts.index, "Count": counts.to_numpy()}),
+        names="Position",
+        values="Count",
+        title=f"Position Distribution - {nationality}",
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        hole=0.3,
+    )
+    fig.update_layout(
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5),
+        **STYLE,
+    )
+    fig.update_traces(
+        textposition="inside",
+        textinfo="percent+label",
+        insidetextfont=dict(color="white"),
+        hoverinfo="label+percent+value",
+        marker=dict(line=dict(color="white", width=2)),
+    )
+    return fig
+
+
+def reference_potential_age_scatter(dash, filtered_df, nationality):
+    """Per-player potential vs age scatter built with plotly express."""
+    plot_df = filtered_df.astype(
+        {
+            col: "float64"
+            for col in dash.numeric_columns
+            if filtered_df[col].dtype == "UInt8"
+        }
+    )
+    fig = px.scatter(
+        plot_df,
+        x="Age",
+        y="Potential",
+        color="Overall",
+        size="Overall",
+        hover_name="Name",
+        hover_data=["Club", "Preferred Positions"],
+        title=f"Potential vs Age - {nationality}",
+        color_continuous_scale="Viridis",
+        render_mode=("webgl" if len(plot_df) > dash.SCATTER_WEBGL_THRESHOLD else "svg"),
+    )
+    fig.update_layout(
+        xaxis=dict(title="Age"), yaxis=dict(title="Potential Rating"), **STYLE
+    )
+    return fig
+
+
+def reference_aggregated_potential_age_scatter(dash, filtered_df, nationality):
+    """Aggregated potential vs age scatter built with plotly express from the
+    players grouped by (Age, Potential)."""
+    points = (
+        filtered_df.astype(
+            {
+                col: "float64"
+                for col in dash.numeric_columns
+                if filtered_df[col].dtype == "UInt8"
+            }
+        )
+        .groupby(["Age", "Potential"])["Overall"]
+        .agg(["size", "mean"])
+        .reset_index()
+    )
+    fig = px.scatter(
+        points,
+        x="Age",
+        y="Potential",
+        size="size",
+        color="mean",
+        custom_data=["size", "mean"],
+        labels={"mean": "Average Overall"},
+        title=f"Potential vs Age - {nationality} ({len(filtered_df)} players)",
+        color_continuous_scale="Viridis",
+        size_max=30,
+        render_mode="webgl",
+    )
+    fig.update_traces(
+        marker_sizemin=3,
+        hovertemplate=(
+            "Age=%{x}<br>Potential=%{y}<br>Players=%{customdata[0]}"
+            "<br>Average Overall=%{customdata[1]:.1f}<extra></extra>"
+        ),
+    )
+    fig.update_layout(
+        xaxis=dict(title="Age"), yaxis=dict(title="Potential Rating"), **STYLE
+    )
+    return fig
+
+
+def reference_correlation_heatmap(dash, filtered_df, nationality):
+    """Correlation heatmap built with graph_objects from the nation's rows."""
+    columns = [col for col in dash.corr_columns if col in filtered_df.columns]
+    corr_matrix = filtered_df[columns].astype("float64").corr()
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=corr_matrix.values,
+            x=corr_matrix.columns,
+            y=corr_matrix.columns,
+            colorscale="YlGnBu",
+            colorbar=dict(title="Correlation"),
+            hovertemplate="%{y} vs %{x}<br>Correlation: %{z:.2f}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title=f"Skill Correlation Heatmap - {nationality}", **{**STYLE, "height": 600}
+    )
+    return fig
+
+
+def reference_radar_chart(dash, data, player1, player2):
+    """Radar chart built with graph_objects from each player's first row."""
+    fig = go.Figure()
+    labels = []
+    for key in (player1, player2):
+        nationality, name = dash.split_player_key(key)
+        players = data.nation_df(nationality)
+        player = players[players["Name"] == name].iloc[0]
+        skills = [skill for skill in dash.skill_columns if skill in players.columns]
+        labels.append(dash.player_option(key)["label"])
+        fig.add_trace(
+            go.Scatterpolar(
+                r=player[skills].astype("float64").tolist(),
+                theta=skills,
+                fill="toself",
+                name=labels[-1],
+            )
+        )
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        title=f"Skill Comparison: {labels[0]} vs {labels[1]}",
+        **{**STYLE, "margin": dict(l=40, r=40, t=60, b=40), "height": 500},
+    )
+    return fig
+
+
+def reference_club_chart(data, metric, nationality):
+    """Club chart built with plotly express from the same aggregate slice."""
+    stats = data.aggregate_cube.stats("nationality_club", metric)
+    club_stats = stats.xs(nationality, level="Nationality")[["mean", "count"]]
+    club_stats = club_stats.reset_index()
+    club_stats = (
+        club_stats[club_stats["count"] >= 2]
+        .sort_values(by="mean", ascending=False)
+        .head(10)
+    )
+    fig = px.bar(
+        club_stats,
+        x="Club",
+        y="mean",
+        color="mean",
+        color_continuous_scale="Bluered",
+        title=f"Top 10 Clubs by Average {metric} - {nationality} Players",
+        text="count",
+    )
+    fig.update_layout(
+        xaxis=dict(title="Club", tickangle=-45),
+        yaxis=dict(title=f"Average {metric}"),
+        coloraxis_showscale=True,
+        **STYLE,
+    )
+    fig.update_traces(texttemplate="%{text} players", textposition="outside")
+    return fig
+
+
+def reference_overall_chart(data, skill):
+    """Overall chart built with plotly express from the same aggregates."""
+    skill_by_nation = (
+        data.aggregate_cube.stats("nationality", skill)["mean"]
+        .sort_values(ascending=False)
+        .head(15)
+        .rename(skill)
+        .reset_index()
+    )
+    fig = px.bar(
+        skill_by_nation,
+        x="Nationality",
+        y=skill,
+        color=skill,
+        color_continuous_scale="Viridis",
+        title=f"Top 15 Nations by Average {skill} Rating",
+    )
+    fig.update_layout(
+        xaxis=dict(title="Nationality", tickangle=-45),
+        yaxis=dict(title=f"Average {skill} Rating"),
+        coloraxis_showscale=True,
+        **STYLE,
+    )
+    return fig
+
+
+def age_histogram_summaries(reference, figure):
+    """Return the per-position bin counts and quartiles of both age histograms.
+
+    The reference is the raw plotly express histogram, which holds every
+    player's age per positions string; its ages are split across the listed
+    positions and binned with the bins of the dict figure.
+    """
+    reference, figure = figure_data(reference), figure_data(figure)
+    bars = [trace for trace in figure["data"] if trace["type"] == "bar"]
+    width = bars[0]["width"] if bars else 1
+    start = min((min(bar["x"]) for bar in bars), default=0) - (width - 1) / 2
+
+    ages = {}
+    for trace in reference["data"]:
+        if trace["type"] == "histogram":
+            for position in trace["name"].split() or ["Unknown"]:
+                ages.setdefault(position, []).extend(trace["x"])
+    expected = []
+    for position, values in sorted(ages.items()):
+        values = np.array(values, dtype="float64")
+        bins, counts = np.unique((values - start) // width, return_counts=True)
+        centers = start + width * bins + (width - 1) / 2
+        expected.append(
+            [position]
+            + [list(pair) for pair in zip(centers.tolist(), counts.tolist())]
+            + np.percentile(values, [25, 50, 75]).tolist()
+        )
+
+    boxes = {trace["name"]: trace for trace in figure["data"] if trace["type"] == "box"}
+    actual = [
+        [bar["name"]]
+        + [[x, int(y)] for x, y in zip(bar["x"], bar["y"])]
+        + [boxes[bar["name"]][key][0] for key in ("q1", "median", "q3")]
+        for bar in sorted(bars, key=lambda bar: bar["name"])
+    ]
+    return expected, actual
+
+
+# Charts whose reference differs in form from the dict figure, compared
+# through a summary of both instead
+FIGURE_SUMMARIES = {"age_histogram": age_histogram_summaries}
+
+
+def get_figure_pairs(dash, data, nationality, skill):
+    """Return (reference, dict builder) pairs for every dashboard figure.
+
+    Each reference builds the figure with plotly express or graph_objects
+    from the nation's rows, as the dashboard did before its dict figure
+    builders. The binned age histogram is referenced by the raw plotly
+    express histogram.
+    """
+    filtered_df = data.nation_df(nationality)
+    names = filtered_df["Name"]
+    player1 = dash.player_key(nationality, names.iloc[0])
+    player2 = dash.player_key(nationality, names.iloc[-1])
+    builders = {
+        "top_players_bar": lambda: dash.make_top_players_bar(data, nationality, skill),
+        "position_pie": lambda: dash.make_position_pie(data, nationality),
+        "age_histogram": lambda: dash.make_binned_age_histogram(
+            filtered_df, nationality
+        ),
+        "potential_age_scatter": lambda: dash.make_potential_age_scatter(
+            filtered_df, nationality
+        ),
+        "correlation_heatmap": lambda: dash.make_correlation_heatmap(data, nationality),
+        "radar_chart": lambda: dash.update_radar_chart(data, player1, player2),
+        "club_chart": lambda: dash.update_club_chart(data, "Overall", nationality),
+        "overall_chart": lambda: dash.update_overall_chart(data, skill),
+    }
+    references = {
+        "top_players_bar": lambda: reference_top_players_bar(
+            filtered_df, nationality, skill
+        ),
+        "position_pie": lambda: reference_position_pie(data, nationality),
+        "age_histogram": lambda: dash.make_raw_age_histogram(filtered_df, nationality),
+        "correlation_heatmap": lambda: reference_correlation_heatmap(
+            dash, filtered_df, nationality
+        ),
+        "radar_chart": lambda: reference_radar_chart(dash, data, player1, player2),
+        "club_chart": lambda: reference_club_chart(data, "Overall", nationality),
+        "overall_chart": lambda: reference_overall_chart(data, skill),
+    }
+    if 0 < dash.SCATTER_AGGREGATE_THRESHOLD < len(filtered_df):
+        references["potential_age_scatter"] = lambda: (
+            reference_aggregated_potential_age_scatter(dash, filtered_df, nationality)
+        )
+    else:
+        references["potential_age_scatter"] = lambda: (
+            reference_potential_age_scatter(dash, filtered_df, nationality)
+        )
+    return {chart: (references[chart], builder) for chart, builder in builders.items()}
+
+
+def figure_data(figure):
+    """Return a figure as plain JSON data, with typed arrays decoded and the
+    template and default-valued properties left out."""
+
+    def decode(value):
+        if isinstance(value, dict) and "bdata" in value:
+            array = np.frombuffer(base64.b64decode(value["bdata"]), value["dtype"])
+            if "shape" in value:
+                array = array.reshape([int(n) for n in value["shape"].split(",")])
+            return [decode(item) for item in array.astype("float64").tolist()]
+        if isinstance(value, dict):
+            return {key: decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        return value
+
+    spec = json.loads(go.Figure(figure).to_json())
+    spec["layout"].pop("template", None)
+    return decode(spec)
+
+
+def same_figure(reference, figure, path="figure"):
+    """Return the first property where ``figure`` differs from ``reference``,
+    or None. Properties plotly express only sets to their defaults may be
+    missing from ``figure``."""
+    if isinstance(reference, dict) and isinstance(figure, dict):
+        for key in figure.keys() - reference.keys():
+            return f"{path}.{key}"
+        for key, value in reference.items():
+            if key in figure:
+                difference = same_figure(value, figure[key], f"{path}.{key}")
+                if difference:
+                    return difference
+        return None
+    if isinstance(reference, list) and isinstance(figure, list):
+        if len(reference) != len(figure):
+            return path
+        for index, (value, other) in enumerate(zip(reference, figure)):
+            difference = same_figure(value, other, f"{path}[{index}]")
+            if difference:
+                return difference
+        return None
+    if isinstance(reference, float) or isinstance(figure, float):
+        if reference is None or figure is None:
+            return None if reference is figure else path
+        return None if math.isclose(reference, figure, abs_tol=1e-9) else path
+    return None if reference == figure else path
+
+
+def run_figures(dash, data, repeat, skill):
+    """Check every dict figure against its reference and time both."""
+    results = {}
+    for size_name, nationality in pick_nations(data).items():
+        pairs = get_figure_pairs(dash, data, nationality, skill)
+        for chart, (reference, builder) in pairs.items():
+            reference_time = time_call(reference, repeat)
+            builder_time = time_call(builder, repeat)
+            summarize = FIGURE_SUMMARIES.get(
+                chart, lambda a, b: (figure_data(a), figure_data(b))
+            )
+            results[f"{chart}[{size_name}]"] = {
+                "difference": same_figure(*summarize(reference(), builder())),
+                "reference_ms": reference_time["median_ms"],
+                "dict_ms": builder_time["median_ms"],
+                "speedup": round(
+                    reference_time["median_ms"] / max(builder_time["median_ms"], 1e-3),
+                    1,
+                ),
+            }
+    return results
+
+
+def run_payloads(dash, data, repeat, skill):
+    """Measure each callback response body before and after compression."""
+    results = {}
+    for size_name, nationality in pick_nations(data).items():
+        outputs = {
+            stage: func
+            for stage, func in get_stages(dash, data, nationality, skill).items()
+            if "." not in stage
+        }
+        outputs["age_histogram.raw"] = lambda: dash.make_raw_age_histogram(
+            data.nation_df(nationality), nationality
+        )
+        for output, func in outputs.items():
+            value = func()
+            body = to_json_plotly(value).encode()
+            result = {
+                "json_bytes": len(body),
+                "gzip_bytes": len(dash.compress_body(body, "gzip")),
+                "encode_ms": time_call(lambda: to_json_plotly(value), repeat)[
+                    "median_ms"
+                ],
+                "encode_stdlib_ms": time_call(
+                    lambda: to_json_plotly(value, engine="json"), repeat
+                )["median_ms"],
+            }
+            if dash.brotli is not None:
+                result["br_bytes"] = len(dash.compress_body(body, "br"))
+            results[f"{output}[{size_name}]"] = result
+    return results
+
+
+def compare(previous, current, threshold):
+    """Print stages whose median time grew by more than ``threshold``."""
+    regressions = 0
+    for rows, stages in current["results"].items():
+        for stage, result in stages.items():
+            before = previous.get("results", {}).get(rows, {}).get(stage)
+            if not before or not before["median_ms"]:
+                continue
+            ratio = result["median_ms"] / before["median_ms"]
+            if ratio > 1 + threshold:
+                regressions += 1
+                print(
+                    f"SLOWER {rows:>8} {stage:<50} "
+                    f"{before['median_ms']:10.2f} -> {result['median_ms']:10.2f} ms"
+                    f" (x{ratio:.2f})"
+                )
+    print(f"{regressions} stage(s) slower by more than {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the dashboard callbacks on synthetic datasets."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skill", default="Dribbling")
+    parser.add_argument("--data-dir", default="benchmark_data")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="previous results file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    paths = {rows: get_dataset(args.data_dir, rows) for rows in args.sizes}
+    dash = importlib.import_module("Fifa2018_Dash_App")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "results": {},
+        "figures": {},
+        "payloads": {},
+    }
+    for rows, path in paths.items():
+        print(f"Benchmarking {rows} rows ...")
+        results, data = run_size(dash, path, args.repeat, args.skill)
+        report["results"][str(rows)] = results
+        for stage, result in results.items():
+            print(f"  {stage:<50} {result['median_ms']:10.2f} ms")
+
+        figures = run_figures(dash, data, args.repeat, args.skill)
+        report["figures"][str(rows)] = figures
+        print("  Figures: reference (plotly express / graph_objects) vs dict")
+        for chart, result in figures.items():
+            print(
+                f"  {chart:<50} {result['reference_ms']:10.2f} ms"
+                f" {result['dict_ms']:10.2f} ms  x{result['speedup']:<6}"
+                f" {'same' if result['difference'] is None else 'DIFFERS at ' + result['difference']}"
+            )
+
+        payloads = run_payloads(dash, data, args.repeat, args.skill)
+        report["payloads"][str(rows)] = payloads
+        print("  Payloads: JSON -> compressed bytes, encode time (orjson / json)")
+        for output, result in payloads.items():
+            compressed = f"{result['gzip_bytes']:>9} gzip"
+            if "br_bytes" in result:
+                compressed += f" {result['br_bytes']:>9} br"
+            print(
+                f"  {output:<50} {result['json_bytes']:>10} -> {compressed}"
+                f" {result['encode_ms']:8.2f} / {result['encode_stdlib_ms']:.2f} ms"
+            )
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
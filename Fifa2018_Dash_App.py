@@ -1,15 +1,44 @@
 # Import packages
-from dash import Dash, html, dash_table, dcc, callback, Output, Input, State
+import base64
+import collections
+import concurrent.futures
+import functools
+import gc
+import gzip
+import math
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+
+from dash import Dash, html, dash_table, dcc, ctx, Output, Input, State
+from flask import Response, current_app, g, request
 import pandas as pd
+import plotly.colors
 import plotly.express as px
-import plotly.graph_objects as go
+import plotly.io as pio
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
 
 # Incorporate data
-file_name = "Fifa2018_dataset.csv"
-df = pd.read_csv(file_name)
+file_name = os.environ.get("FIFA_DATASET", "Fifa2018_dataset.csv")
 
-# Convert skill columns to numeric preemptively
+# Skill columns, converted to numeric when the dataset is loaded
 skill_columns = [
     "Ball control",
     "Dribbling",
@@ -23,18 +52,1213 @@ skill_columns = [
     "Stamina",
 ]
 
-for col in skill_columns:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+# Skills offered by the skill radio; each nation's descending ordering by
+# them is precomputed for the top players bar and the players table
+ranked_skills = ["Ball control", "Dribbling", "Finishing", "Acceleration", "Aggression"]
 
-# Convert age, potential, and overall rating to numeric
+# Age, potential, and overall rating, also converted to numeric
 numeric_columns = ["Age", "Potential", "Overall"]
-for col in numeric_columns:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
 
-# Initialize the app
-app = Dash(__name__, suppress_callback_exceptions=True)
+# Columns compared in the skill correlation heatmap
+corr_columns = [
+    "Overall",
+    "Potential",
+    "Ball control",
+    "Dribbling",
+    "Finishing",
+    "Acceleration",
+    "Aggression",
+    "Agility",
+    "Balance",
+    "Composure",
+    "Strength",
+]
+
+# String dimensions stored as categoricals in compact mode
+category_columns = ["Nationality", "Club", "Preferred Positions"]
+
+# Columns the dashboard reads; compact mode drops every other column
+used_columns = ["Name"] + category_columns + numeric_columns + skill_columns
+
+# Load the dataset with categorical and 8-bit integer dtypes to save memory
+COMPACT_LOAD = os.environ.get("FIFA_COMPACT_LOAD", "0") == "1"
+
+# Typed binary copy of the dataset, stored next to the CSV. Bump the version
+# whenever the preparation done in load_csv_dataset changes.
+CACHE_VERSION = 2
+
+
+def get_cache_paths(path):
+    """Return the (data, metadata) cache file paths for a CSV file."""
+    base = os.path.splitext(path)[0]
+    return base + ".cache.feather", base + ".cache.json"
+
+
+def get_file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Ratings written as a base and an in-form delta, such as "81+2" or "70-1"
+RATING_DELTA_PATTERN = r"^\s*(?P<base>\d+)\s*(?P<sign>[+-])\s*(?P<delta>\d+)\s*$"
+
+
+# Skill ratings are read as text and parsed by parse_rating_column, so pandas
+# does not guess a different type for each block of a large file
+rating_dtypes = {col: str for col in skill_columns}
+
+
+def parse_rating_column(series):
+    """Convert a rating column to numeric, evaluating "base+delta" strings.
+
+    Text columns are parsed with vectorized pyarrow kernels: plain digit
+    strings are cast directly and the rest are matched against
+    RATING_DELTA_PATTERN. Cells matching neither fall back to
+    ``pd.to_numeric`` and become NaN if that fails too. Returns the numeric
+    column and the number of "base+delta" cells evaluated.
+    """
+    if series.dtype != object:
+        return pd.to_numeric(series, errors="coerce"), 0
+
+    # Large CSVs can mix ints and strings in one column (pandas parses them in
+    # blocks), so render every cell as text before handing it to pyarrow
+    text = pa.array(series.astype("string"), type=pa.string())
+    plain = pc.fill_null(pc.utf8_is_digit(text), False).to_numpy(zero_copy_only=False)
+    values = np.full(len(text), np.nan)
+    values[plain] = pc.cast(text.filter(plain), pa.float64()).to_numpy(
+        zero_copy_only=False
+    )
+
+    rest = np.flatnonzero(~plain & series.notna().to_numpy())
+    repaired = 0
+    if len(rest):
+        base, sign, delta = pc.extract_regex(
+            text.take(rest), RATING_DELTA_PATTERN
+        ).flatten()
+        delta = pc.cast(delta, pa.float64())
+        delta = pc.if_else(pc.equal(sign, "-"), pc.negate(delta), delta)
+        evaluated = pc.add(pc.cast(base, pa.float64()), delta)
+        values[rest] = evaluated.to_numpy(zero_copy_only=False)
+        repaired = len(evaluated) - evaluated.null_count
+
+        unmatched = rest[np.isnan(values[rest])]
+        if len(unmatched):
+            values[unmatched] = pd.to_numeric(
+                series.iloc[unmatched], errors="coerce"
+            ).to_numpy(dtype=float)
+
+    if not np.isnan(values).any() and np.array_equal(values, np.round(values)):
+        values = values.astype(np.int64)
+    return pd.Series(values, index=series.index, name=series.name), repaired
+
+
+def coerce_numeric_columns(frame):
+    """Convert the rating columns of a parsed CSV (or chunk) to numeric.
+
+    Returns the frame and the number of "base+delta" cells repaired.
+    """
+    repaired = 0
+    for col in skill_columns + numeric_columns:
+        if col in frame.columns:
+            frame[col], count = parse_rating_column(frame[col])
+            repaired += count
+    return frame, repaired
+
+
+def load_csv_dataset(path):
+    """Parse the CSV and convert the rating columns to numeric."""
+    frame, repaired = coerce_numeric_columns(pd.read_csv(path, dtype=rating_dtypes))
+    logger.info("Repaired %d base+delta ratings in %s", repaired, path)
+    return frame
+
+
+def compact_dataset(frame):
+    """Return a compact copy of the dataset for memory-constrained workers.
+
+    Unused columns are dropped, string dimensions become categoricals and
+    ratings and ages in the 0-255 range become nullable ``UInt8``.
+    """
+    frame = frame[[col for col in used_columns if col in frame.columns]].copy()
+    for col in category_columns:
+        if col in frame.columns:
+            frame[col] = frame[col].astype("category")
+    for col in numeric_columns + skill_columns:
+        if col not in frame.columns:
+            continue
+        values = frame[col].dropna()
+        if values.between(0, 255).all() and (values == values.round()).all():
+            frame[col] = frame[col].astype("UInt8")
+    return frame
+
+
+def get_memory_report(before, after):
+    """Return bytes per column before and after compacting the dataset."""
+    before_bytes = before.memory_usage(index=False, deep=True)
+    after_bytes = after.memory_usage(index=False, deep=True)
+    return {
+        col: [int(size), int(after_bytes.get(col, 0))]
+        for col, size in before_bytes.items()
+    }
+
+
+def log_memory_report(report):
+    """Log the per-column memory report built by get_memory_report."""
+    logger.info("%-22s %12s %12s", "Column", "Before", "After")
+    for col, (before, after) in report.items():
+        logger.info("%-22s %12d %12d", col, before, after)
+    logger.info(
+        "%-22s %12d %12d",
+        "Total",
+        sum(before for before, _ in report.values()),
+        sum(after for _, after in report.values()),
+    )
+
+
+def _write_cache_meta(meta_path, meta):
+    """Record which CSV contents the cache file was built from."""
+    tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def load_dataset(path, compact=False):
+    """Load the prepared dataset, using the binary cache when it is current.
+
+    The cache is trusted when the CSV's size and mtime match the recorded
+    ones; otherwise the CSV is hashed and the cache is still reused if the
+    contents are unchanged. A missing or stale cache, or one built for the
+    other load mode, is rebuilt from the CSV. In compact mode the memory
+    report recorded when the cache was built is logged.
+    """
+    cache_path, meta_path = get_cache_paths(path)
+    stat = os.stat(path)
+    source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+
+    frame = None
+    digest = None
+    if (
+        meta.get("version") == CACHE_VERSION
+        and meta.get("compact", False) == compact
+        and os.path.exists(cache_path)
+    ):
+        if meta.get("source") == source:
+            frame = pd.read_feather(cache_path)
+        else:
+            digest = get_file_digest(path)
+            if meta.get("sha256") == digest:
+                meta["source"] = source
+                try:
+                    _write_cache_meta(meta_path, meta)
+                except OSError:
+                    pass
+                frame = pd.read_feather(cache_path)
+
+    if frame is None:
+        frame = load_csv_dataset(path)
+        meta = {"version": CACHE_VERSION, "compact": compact, "source": source}
+        if compact:
+            compacted = compact_dataset(frame)
+            meta["memory_report"] = get_memory_report(frame, compacted)
+            frame = compacted
+        try:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            frame.to_feather(tmp_path)
+            os.replace(tmp_path, cache_path)
+            meta["sha256"] = digest or get_file_digest(path)
+            _write_cache_meta(meta_path, meta)
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("Could not write dataset cache %s: %s", cache_path, exc)
+
+    if compact and "memory_report" in meta:
+        log_memory_report(meta["memory_report"])
+    return frame
+
+
+# Maximum number of (nationality, skill) views kept by the figure cache
+FIGURE_CACHE_SIZE = int(os.environ.get("FIFA_FIGURE_CACHE_SIZE", "128"))
+
+# "binned" sends per-bin counts and box statistics computed on the server;
+# "raw" embeds every player's age and lets the browser bin them
+AGE_HISTOGRAM_MODE = os.environ.get("FIFA_AGE_HISTOGRAM", "binned")
+AGE_HISTOGRAM_BINS = 25
+
+# The potential vs age scatter switches to WebGL above this many players, and
+# above the aggregation threshold (0 disables it) draws one weighted marker per
+# distinct (Age, Potential) pair instead of one marker per player
+SCATTER_WEBGL_THRESHOLD = int(os.environ.get("FIFA_SCATTER_WEBGL_THRESHOLD", "1000"))
+SCATTER_AGGREGATE_THRESHOLD = int(
+    os.environ.get("FIFA_SCATTER_AGGREGATE_THRESHOLD", "5000")
+)
+
+# Figures are built as plain dicts straight from NumPy arrays instead of going
+# through plotly express and the graph_objects validators. Every figure starts
+# from the same prebuilt layout: the default plotly template with the
+# dashboard's white background, margins and height. Numeric arrays are sent as
+# base64 typed arrays (see typed_array), and Dash serializes the dicts through
+# plotly.io.json, which uses orjson when it is installed.
+BASE_LAYOUT = {
+    "template": pio.templates[pio.templates.default].to_plotly_json(),
+    "plot_bgcolor": "white",
+    "paper_bgcolor": "white",
+    "margin": {"l": 20, "r": 20, "t": 60, "b": 20},
+    "height": 450,
+}
+
+# Named color scales resolved as plotly.py does, since plotly.js has its own
+# (different) scales under some of the same names
+COLORSCALES = {
+    name: plotly.colors.get_colorscale(name)
+    for name in ("Viridis", "YlGnBu", "Bluered")
+}
+
+# plotly.js typed array codes of the NumPy dtypes sent as base64
+TYPED_ARRAY_CODES = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+
+def typed_array(values):
+    """Encode a numeric array as a plotly.js base64 typed array.
+
+    Integers are narrowed to the smallest type that holds them, as plotly.py
+    does for figure objects.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu" and values.size:
+        low, high = values.min(), values.max()
+        for dtype in ("int8", "int16", "int32"):
+            if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+                values = values.astype(dtype)
+                break
+    code = TYPED_ARRAY_CODES.get(values.dtype.name)
+    if code is None:
+        return values.tolist()
+    spec = {
+        "dtype": code,
+        "bdata": base64.b64encode(np.ascontiguousarray(values)).decode("ascii"),
+    }
+    if values.ndim > 1:
+        spec["shape"] = ", ".join(map(str, values.shape))
+    return spec
+
+
+def numeric_values(series):
+    """Return a numeric column as an array, integer when nothing is missing."""
+    if pd.api.types.is_integer_dtype(series.dtype) and not series.hasnans:
+        return series.to_numpy(dtype="int64")
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def figure_layout(title, **layout):
+    """Return the shared base layout with a title and chart-specific settings."""
+    return {**BASE_LAYOUT, "title": {"text": title}, **layout}
+
+
+def axis_layout(title, **axis):
+    """Return an axis layout with a title."""
+    return {"title": {"text": title}, **axis}
+
+
+def make_figure(traces, layout=None):
+    """Return a figure dict, as accepted by dcc.Graph."""
+    return {"data": traces, "layout": layout or {"template": BASE_LAYOUT["template"]}}
+
+
+def split_positions(strings):
+    """Split preferred positions strings into one row per listed position.
+
+    The export separates positions with spaces and ends each string with one,
+    so strings are split on whitespace; missing or blank strings count as a
+    single "Unknown" position. The result keeps the index of ``strings``.
+    """
+    return (
+        pd.Series(strings, dtype=object)
+        .fillna("Unknown")
+        .astype(str)
+        .str.split()
+        .explode()
+        .fillna("Unknown")
+    )
+
+
+def build_position_counts(frame):
+    """Count every listed preferred position per nationality.
+
+    Returns a nationality x position matrix. Rows are first counted per
+    distinct position string, so only those strings are split, and the pie
+    chart reads a single row instead of splitting strings per request.
+    """
+    combos = (
+        pd.DataFrame(
+            {
+                "Nationality": frame["Nationality"].astype(object),
+                "Position": frame["Preferred Positions"]
+                .astype(object)
+                .fillna("Unknown")
+                .astype(str),
+            }
+        )
+        .groupby(["Nationality", "Position"])
+        .size()
+        .rename("Count")
+        .reset_index()
+    )
+    positions = split_positions(combos.pop("Position")).rename("Position")
+    return (
+        combos.join(positions)
+        .groupby(["Nationality", "Position"])["Count"]
+        .sum()
+        .unstack(fill_value=0)
+    )
+
+
+class CorrelationStore:
+    """Pairwise-complete correlation matrices per nationality.
+
+    For each nationality the store keeps four k x k accumulators over the rows
+    where both columns i and j are present: the row count, the sum of column
+    i, the sum of squares of column i and the cross-product sum. These are
+    enough to derive the same matrices as ``DataFrame.corr()`` for every nation
+    and for the whole dataset, and appending rows only adds their own sums.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.nations = {}
+        size = len(self.columns)
+        self._sums = np.zeros((0, 4, size, size))
+        self._total = np.zeros((4, size, size))
+        self._matrices = None
+
+    def update(self, frame):
+        """Add the rows of ``frame`` to the accumulators."""
+        values = frame[self.columns].to_numpy(dtype="float64", na_value=np.nan)
+        groups = frame.groupby("Nationality", sort=False, observed=True).indices
+        new_nations = [nat for nat in groups if nat not in self.nations]
+        if new_nations:
+            for nat in new_nations:
+                self.nations[nat] = len(self.nations)
+            self._sums = np.concatenate(
+                [self._sums, np.zeros((len(new_nations),) + self._sums.shape[1:])]
+            )
+        for nat, rows in groups.items():
+            self._sums[self.nations[nat]] += self._accumulate(values[rows])
+        self._total += self._accumulate(values)
+        self._matrices = None
+
+    @staticmethod
+    def _accumulate(values):
+        present = ~np.isnan(values)
+        weights = present.astype("float64")
+        filled = np.where(present, values, 0.0)
+        return np.stack(
+            [
+                weights.T @ weights,
+                filled.T @ weights,
+                (filled * filled).T @ weights,
+                filled.T @ filled,
+            ]
+        )
+
+    @staticmethod
+    def _to_correlation(sums):
+        count, total, squares, products = np.moveaxis(sums, -3, 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = products - total * np.swapaxes(total, -1, -2) / count
+            variance = squares - total * total / count
+            corr = covariance / np.sqrt(variance * np.swapaxes(variance, -1, -2))
+        corr[~np.isfinite(corr)] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+    def correlation(self, nationality):
+        """Return the correlation matrix of one nationality, or None."""
+        if nationality not in self.nations:
+            return None
+        if self._matrices is None:
+            # Finalize every nation at once and keep the stacked matrices
+            self._matrices = self._to_correlation(self._sums)
+        return pd.DataFrame(
+            self._matrices[self.nations[nationality]],
+            index=self.columns,
+            columns=self.columns,
+        )
+
+    def overall_correlation(self):
+        """Return the correlation matrix of every row added so far."""
+        return pd.DataFrame(
+            self._to_correlation(self._total),
+            index=self.columns,
+            columns=self.columns,
+        )
+
+
+class AggregateCube:
+    """Mean, count, min and max of every metric per nationality, per club and
+    per nationality x club.
+
+    The cube keeps combinable partial aggregates (sum, count, min, max), so it
+    is built with one groupby per level and more rows can be folded in with
+    ``update``. Charts read ready-made slices from ``stats`` and never group
+    or modify the shared dataset.
+    """
+
+    levels = {
+        "nationality": ["Nationality"],
+        "club": ["Club"],
+        "nationality_club": ["Nationality", "Club"],
+    }
+    partials = ("sum", "count", "min", "max")
+
+    def __init__(self, metrics):
+        self.metrics = list(metrics)
+        self._partials = {}
+        self._stats = {}
+
+    def update(self, frame):
+        """Fold the rows of ``frame`` into every level of the cube."""
+        for level, keys in self.levels.items():
+            grouped = frame.groupby(keys, observed=True)[self.metrics]
+            parts = {name: grouped.agg(name) for name in self.partials}
+            if level in self._partials:
+                for name, part in parts.items():
+                    combined = pd.concat([self._partials[level][name], part])
+                    grouped_parts = combined.groupby(level=keys, observed=True)
+                    parts[name] = getattr(
+                        grouped_parts, "sum" if name == "count" else name
+                    )()
+            self._partials[level] = parts
+        self._stats = {}
+
+    def stats(self, level, metric):
+        """Return the mean/count/min/max columns of one metric at a level."""
+        key = (level, metric)
+        if key not in self._stats:
+            # Finalized on read (or by finalize), so folding in many chunks
+            # does not rebuild every metric's stats after each one
+            parts = {name: part[metric] for name, part in self._partials[level].items()}
+            self._stats[key] = pd.DataFrame(
+                {
+                    "mean": parts["sum"] / parts["count"].where(parts["count"] > 0),
+                    "count": parts["count"],
+                    "min": parts["min"],
+                    "max": parts["max"],
+                }
+            )
+        return self._stats[key]
+
+    def finalize(self):
+        """Build the stats of every level and metric ahead of the first read."""
+        for level in self._partials:
+            for metric in self.metrics:
+                self.stats(level, metric)
+
+
+# Player dropdown values identify a player across nationalities
+PLAYER_KEY_SEPARATOR = "::"
+
+# Most players returned by a player dropdown search
+PLAYER_SEARCH_LIMIT = int(os.environ.get("FIFA_PLAYER_SEARCH_LIMIT", "20"))
+
+
+def player_key(nationality, name):
+    """Return the player dropdown value of a player."""
+    return f"{nationality}{PLAYER_KEY_SEPARATOR}{name}"
+
+
+def split_player_key(key):
+    """Return the (nationality, name) of a player dropdown value."""
+    nationality, _, name = key.partition(PLAYER_KEY_SEPARATOR)
+    return nationality, name
+
+
+def player_option(key):
+    """Return the player dropdown option of a player dropdown value."""
+    nationality, name = split_player_key(key)
+    return {"label": f"{name} ({nationality})", "value": key}
+
+
+class PlayerIndex:
+    """Sorted name index over every player, for the player dropdown search.
+
+    Each (nationality, name) player is indexed under the lower-cased full name
+    and under each word of it, so "messi" finds "L. Messi". A search takes
+    the range of keys starting with the typed text with two binary searches
+    and returns the best rated players in it.
+    """
+
+    def __init__(self, nationalities, names, ratings):
+        self.nationalities = np.asarray(nationalities, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.ratings = np.nan_to_num(np.asarray(ratings, dtype="float64"), nan=-np.inf)
+        lowered = pd.Series(self.names, dtype=object).fillna("").str.lower()
+        words = lowered.str.split().explode().dropna()
+        keys = np.concatenate(
+            [lowered.to_numpy(dtype=object), words.to_numpy(dtype=object)]
+        )
+        ids = np.concatenate([np.arange(len(lowered)), words.index.to_numpy()])
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.ids = ids[order]
+        # Most keys a single player has, so the best ``limit * entries`` keys
+        # of a range always hold ``limit`` distinct players
+        self.entries = 1 + int(words.index.value_counts().max()) if len(words) else 1
+
+    def search(self, text, limit=PLAYER_SEARCH_LIMIT):
+        """Return the best rated (nationality, name) pairs matching ``text``."""
+        text = (text or "").strip().lower()
+        if not text:
+            return []
+        start = np.searchsorted(self.keys, text, side="left")
+        stop = np.searchsorted(self.keys, text + "\U0010ffff", side="left")
+        ids = self.ids[start:stop]
+        candidates = limit * self.entries
+        if len(ids) > candidates:
+            ids = ids[np.argpartition(-self.ratings[ids], candidates - 1)[:candidates]]
+        ids = ids[np.argsort(-self.ratings[ids], kind="stable")]
+        _, first = np.unique(ids, return_index=True)
+        ids = ids[np.sort(first)][:limit]
+        return list(zip(self.nationalities[ids], self.names[ids]))
+
+
+# Every prepared dataset is numbered when it is built. The figure caches are
+# keyed on that generation number and look the data up here, where it is only
+# held weakly.
+data_generations = itertools.count(1)
+live_datasets = weakref.WeakValueDictionary()
+
+
+def register_dataset(data):
+    """Number a newly prepared dataset and return its generation."""
+    generation = next(data_generations)
+    live_datasets[generation] = data
+    return generation
+
+
+def descending_order(values):
+    """Positions ordering ``values`` by descending rating, ties in row order.
+
+    Missing ratings come last, as with ``sort_values(ascending=False,
+    kind="stable")``.
+    """
+    values = np.asarray(values, dtype="float64")
+    return np.argsort(-values, kind="stable").astype(np.int32)
+
+
+class DashboardData:
+    """The prepared dataset and every index the callbacks read.
+
+    Built once per process (or once in the Gunicorn master with
+    ``--preload``) and only read afterwards, so forked workers share it.
+    """
+
+    def __init__(self, frame):
+        # Partition the data by nationality. Rows are stably sorted so every
+        # nation occupies one contiguous block, and callbacks take that block
+        # as a slice instead of scanning the whole frame with a boolean mask.
+        self.df = frame.sort_values("Nationality", kind="stable", ignore_index=True)
+        self.nation_slices = {
+            nat: slice(rows[0], rows[-1] + 1)
+            for nat, rows in self.df.groupby(
+                "Nationality", sort=False, observed=True
+            ).indices.items()
+        }
+        self.nation_sizes = {
+            nat: rows.stop - rows.start for nat, rows in self.nation_slices.items()
+        }
+        self.nationalities = sorted(self.nation_slices)
+
+        self.position_counts = build_position_counts(self.df)
+
+        self.correlation_store = CorrelationStore(
+            [col for col in corr_columns if col in self.df.columns]
+        )
+        self.correlation_store.update(self.df)
+
+        self.aggregate_cube = AggregateCube(
+            [col for col in skill_columns + numeric_columns if col in self.df.columns]
+        )
+        self.aggregate_cube.update(self.df)
+        self.aggregate_cube.finalize()
+        self.generation = register_dataset(self)
+
+        # Descending orderings of every nation by each selectable skill, for
+        # the top players bar and the default table sort. One lexsort per
+        # skill orders the whole frame by (nation block, -rating); each
+        # nation's block of the result is then stored relative to its slice.
+        row_block = np.full(len(self.df), len(self.nation_slices), dtype=np.int32)
+        row_start = np.zeros(len(self.df), dtype=np.int64)
+        for block, rows in enumerate(
+            sorted(self.nation_slices.values(), key=lambda rows: rows.start)
+        ):
+            row_block[rows] = block
+            row_start[rows] = rows.start
+        self.skill_orders = {}
+        for skill in ranked_skills:
+            if skill in self.df.columns:
+                values = self.df[skill].to_numpy(dtype="float64", na_value=np.nan)
+                order = np.lexsort((-values, row_block))
+                self.skill_orders[skill] = (order - row_start[order]).astype(np.int32)
+
+        # Radar chart skills held as one contiguous float32 matrix, with a hash
+        # index from (nationality, name) to the matrix row. A duplicated name
+        # keeps its first row, which is the player listed first for that nation.
+        self.radar_skills = [
+            skill for skill in skill_columns if skill in self.df.columns
+        ]
+        self.skill_matrix = np.ascontiguousarray(
+            self.df[self.radar_skills].to_numpy(dtype="float32", na_value=np.nan)
+        )
+        first_rows = np.flatnonzero(
+            ~self.df.duplicated(["Nationality", "Name"]).to_numpy()
+        )
+        first_players = self.df.iloc[first_rows]
+        self.player_rows = dict(
+            zip(
+                zip(first_players["Nationality"], first_players["Name"]),
+                first_rows.tolist(),
+            )
+        )
+        self.player_index = PlayerIndex(
+            first_players["Nationality"].astype(object),
+            first_players["Name"].astype(object),
+            first_players["Overall"].to_numpy(dtype="float64", na_value=np.nan),
+        )
+
+    def nation_df(self, nationality):
+        """Return the rows of one nationality as a slice of ``df`` (no copy)."""
+        return self.df.iloc[self.nation_slices.get(nationality, slice(0, 0))]
+
+    def skill_order(self, nationality, skill):
+        """Return positions in ``nation_df`` ordering it by descending skill."""
+        rows = self.nation_slices.get(nationality, slice(0, 0))
+        if skill in self.skill_orders:
+            return self.skill_orders[skill][rows]
+        return descending_order(
+            self.df[skill].iloc[rows].to_numpy(dtype="float64", na_value=np.nan)
+        )
+
+    def player_skills(self, nationality, name):
+        """Return a player's radar skills as float32, or None if not found."""
+        row = self.player_rows.get((nationality, name))
+        return None if row is None else self.skill_matrix[row]
+
+
+# Streaming ingestion for datasets larger than memory: with FIFA_CHUNK_SIZE set
+# to a number of rows, the CSV is read that many rows at a time, the aggregates
+# are accumulated chunk by chunk, and each nationality's rows are written to
+# its own Arrow file under FIFA_PARTITION_DIR (default: the system temporary
+# directory). At most FIFA_PARTITION_CACHE_SIZE nationalities are held in
+# memory. 0 disables streaming.
+CHUNK_SIZE = int(os.environ.get("FIFA_CHUNK_SIZE", "0"))
+PARTITION_DIR = os.environ.get("FIFA_PARTITION_DIR") or None
+PARTITION_CACHE_SIZE = int(os.environ.get("FIFA_PARTITION_CACHE_SIZE", "32"))
+
+# Columns kept as text in partitions, whatever a chunk's values look like
+text_columns = ["Name", "Nationality", "Club", "Preferred Positions"]
+
+
+def _remove_partitions(directory, owner_pid):
+    # Forked Gunicorn workers share the master's partitions; only the process
+    # that wrote them removes them
+    if os.getpid() == owner_pid:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class PartitionCache:
+    """The most recently read nation frames of a partition directory, and the
+    skill orderings computed from them.
+
+    Holds the partition file paths but not the data object that owns them, so
+    dropping that object frees it, and removes its directory, right away
+    rather than at the next garbage collection pass.
+    """
+
+    def __init__(self, files, compact, maxsize=PARTITION_CACHE_SIZE):
+        self.files = files
+        self.compact = compact
+        self.maxsize = maxsize
+        self._frames = collections.OrderedDict()
+        self._orders = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, entries, key, maxsize, build):
+        with self._lock:
+            if key in entries:
+                entries.move_to_end(key)
+                return entries[key]
+        value = build()
+        with self._lock:
+            entries[key] = value
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+        return value
+
+    def _read(self, nationality):
+        frame = pd.read_feather(self.files[nationality])
+        return compact_dataset(frame) if self.compact else frame
+
+    def nation_df(self, nationality):
+        return self._get(
+            self._frames,
+            nationality,
+            self.maxsize,
+            lambda: self._read(nationality),
+        )
+
+    def skill_order(self, nationality, skill):
+        return self._get(
+            self._orders,
+            (nationality, skill),
+            self.maxsize * len(ranked_skills),
+            lambda: descending_order(
+                self.nation_df(nationality)[skill].to_numpy(
+                    dtype="float64", na_value=np.nan
+                )
+            ),
+        )
+
+
+class PartitionedDashboardData:
+    """Dashboard data ingested from the CSV in chunks, kept on disk per nation.
+
+    Provides the same aggregates and lookups as DashboardData without ever
+    holding the whole table: the position counts, correlation store and
+    aggregate cube are accumulated per chunk, and ``nation_df`` reads one
+    nationality's Arrow file, keeping the most recently used ones in memory.
+    The partition directory is removed when the object is discarded.
+    """
+
+    def __init__(self, path, chunk_size, compact=False, directory=PARTITION_DIR):
+        self.compact = compact
+        self.directory = tempfile.mkdtemp(prefix="fifa-partitions-", dir=directory)
+        weakref.finalize(self, _remove_partitions, self.directory, os.getpid())
+
+        self.nation_sizes = {}
+        self.position_counts = None
+        self.correlation_store = None
+        self.aggregate_cube = None
+        self._files = {}
+        self._players = []
+        writers = {}
+        repaired = 0
+        try:
+            for chunk in pd.read_csv(
+                path,
+                chunksize=chunk_size,
+                usecols=lambda col: col in used_columns,
+                dtype={**rating_dtypes, **{col: str for col in text_columns}},
+            ):
+                chunk, count = coerce_numeric_columns(chunk)
+                repaired += count
+                self._add_chunk(chunk, writers)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        logger.info("Repaired %d base+delta ratings in %s", repaired, path)
+
+        self.nationalities = sorted(self.nation_sizes)
+        self.position_counts = self.position_counts.fillna(0).astype("int64")
+        self.aggregate_cube.finalize()
+        self.generation = register_dataset(self)
+        players = pd.concat(self._players, ignore_index=True).drop_duplicates(
+            ["Nationality", "Name"]
+        )
+        del self._players
+        self.player_index = PlayerIndex(
+            players["Nationality"], players["Name"], players["Overall"]
+        )
+        self.radar_skills = [
+            skill for skill in skill_columns if skill in self._empty.columns
+        ]
+        self._cache = PartitionCache(self._files, compact)
+
+    def _add_chunk(self, chunk, writers):
+        if self.aggregate_cube is None:
+            self._schema = pa.schema(
+                [
+                    (col, pa.string() if col in text_columns else pa.float64())
+                    for col in chunk.columns
+                ]
+            )
+            self._empty = pa.Table.from_pylist([], schema=self._schema).to_pandas()
+            self.correlation_store = CorrelationStore(
+                [col for col in corr_columns if col in chunk.columns]
+            )
+            self.aggregate_cube = AggregateCube(
+                [col for col in skill_columns + numeric_columns if col in chunk.columns]
+            )
+
+        counts = build_position_counts(chunk)
+        self.position_counts = (
+            counts
+            if self.position_counts is None
+            else self.position_counts.add(counts, fill_value=0)
+        )
+        self.correlation_store.update(chunk)
+        self.aggregate_cube.update(chunk)
+        self._players.append(
+            chunk.loc[chunk["Nationality"].notna(), ["Nationality", "Name", "Overall"]]
+        )
+
+        for nat, rows in chunk.groupby("Nationality", sort=False).indices.items():
+            if nat not in writers:
+                self._files[nat] = os.path.join(
+                    self.directory, f"nation-{len(self._files)}.arrow"
+                )
+                writers[nat] = pa.ipc.new_file(self._files[nat], self._schema)
+            writers[nat].write_table(
+                pa.Table.from_pandas(
+                    chunk.iloc[rows], schema=self._schema, preserve_index=False
+                )
+            )
+            self.nation_sizes[nat] = self.nation_sizes.get(nat, 0) + len(rows)
+
+    def nation_df(self, nationality):
+        """Return the rows of one nationality, read from its partition."""
+        if nationality not in self._files:
+            return self._empty
+        return self._cache.nation_df(nationality)
+
+    def skill_order(self, nationality, skill):
+        """Return positions in ``nation_df`` ordering it by descending skill.
+
+        Computed when a nationality's skill is first ranked and kept for the
+        most recently used ones.
+        """
+        if nationality not in self._files:
+            return descending_order(np.array([]))
+        return self._cache.skill_order(nationality, skill)
+
+    def player_skills(self, nationality, name):
+        """Return a player's radar skills as float32, or None if not found."""
+        frame = self.nation_df(nationality)
+        rows = np.flatnonzero(frame["Name"].to_numpy(dtype=object) == name)
+        if not len(rows):
+            return None
+        return frame.iloc[rows[0]][self.radar_skills].to_numpy(
+            dtype="float32", na_value=np.nan
+        )
+
+
+def load_dashboard_data(path, compact=False, chunk_size=CHUNK_SIZE):
+    """Prepare the dashboard data of a CSV, streamed when ``chunk_size`` is set."""
+    if chunk_size > 0:
+        return PartitionedDashboardData(path, chunk_size, compact=compact)
+    return DashboardData(load_dataset(path, compact=compact))
+
+
+# Latency and payload histograms, exposed in the Prometheus text format on
+# /metrics. Each Gunicorn worker keeps its own counts.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+SIZE_BUCKETS = (1 << 10, 1 << 12, 1 << 14, 1 << 16, 1 << 18, 1 << 20, 1 << 22)
+METRICS = {
+    "fifa_dash_callback_seconds": (
+        "callback",
+        LATENCY_BUCKETS,
+        "Time spent computing each callback.",
+    ),
+    "fifa_dash_stage_seconds": (
+        "stage",
+        LATENCY_BUCKETS,
+        "Time spent in each stage of the dashboard callbacks.",
+    ),
+    "fifa_dash_request_seconds": (
+        "output",
+        LATENCY_BUCKETS,
+        "Time to answer a callback request, including JSON serialization.",
+    ),
+    "fifa_dash_response_bytes": (
+        "output",
+        SIZE_BUCKETS,
+        "Size of each callback response body as sent, after compression.",
+    ),
+    "fifa_dash_response_json_bytes": (
+        "output",
+        SIZE_BUCKETS,
+        "Size of each callback response body before compression.",
+    ),
+}
+
+# Show /metrics to local requests only unless explicitly made public
+METRICS_PUBLIC = os.environ.get("FIFA_METRICS_PUBLIC", "0") == "1"
+
+
+def escape_label(value):
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Thread-safe histograms keyed by metric name and label value."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, metric, label, value):
+        """Record one observation of ``value`` for ``metric{label}``."""
+        buckets = METRICS[metric][1]
+        with self._lock:
+            histogram = self._histograms.get((metric, label))
+            if histogram is None:
+                histogram = self._histograms[(metric, label)] = {
+                    "buckets": [0] * len(buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram["buckets"][i] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+
+    def render(self):
+        """Return every histogram in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for metric, (label_name, buckets, help_text) in METRICS.items():
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for (name, label), histogram in sorted(self._histograms.items()):
+                    if name != metric:
+                        continue
+                    labels = f'{label_name}="{escape_label(label)}"'
+                    for bound, count in zip(buckets, histogram["buckets"]):
+                        lines.append(
+                            f'{metric}_bucket{{{labels},le="{bound}"}} {count}'
+                        )
+                    lines.append(
+                        f'{metric}_bucket{{{labels},le="+Inf"}} {histogram["count"]}'
+                    )
+                    lines.append(f"{metric}_sum{{{labels}}} {histogram['sum']}")
+                    lines.append(f"{metric}_count{{{labels}}} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def timed(metric, label):
+    """Decorator recording the wall time of each call in ``metric{label}``."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(metric, label, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+class SingleFlight:
+    """Share one in-progress call among concurrent callers with equal arguments.
+
+    The first caller for a set of positional arguments runs the function;
+    callers arriving while it runs wait for it and receive the same result
+    (or exception) instead of computing it again. ``computed`` and
+    ``deduplicated`` count both kinds of calls.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.computed = 0
+        self.deduplicated = 0
+
+    def __call__(self, *args):
+        with self._lock:
+            future = self._calls.get(args)
+            leader = future is None
+            if leader:
+                future = self._calls[args] = concurrent.futures.Future()
+                self.computed += 1
+            else:
+                self.deduplicated += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = self._func(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[args]
+
+
+def start_request_timer():
+    """Remember when the current request started."""
+    g.metrics_start = time.perf_counter()
+
+
+def record_callback_response(response):
+    """Record latency and body size of Dash callback responses.
+
+    Only answered requests for a registered callback are recorded, so clients
+    cannot add label values of their own.
+    """
+    if (
+        request.path.endswith("/_dash-update-component")
+        and "metrics_start" in g
+        and response.status_code in (200, 204)
+    ):
+        body = request.get_json(silent=True) or {}
+        output = body.get("output")
+        callbacks = current_app.extensions["fifa_dashboard"].callback_map
+        if not isinstance(output, str) or output not in callbacks:
+            return response
+        # Label by the first output, e.g. "..a.figure...b.value.." -> "a.figure"
+        output = output.strip(".").split("...")[0]
+        metrics.observe(
+            "fifa_dash_request_seconds", output, time.perf_counter() - g.metrics_start
+        )
+        if not response.direct_passthrough:
+            size = len(response.get_data())
+            metrics.observe("fifa_dash_response_bytes", output, size)
+            metrics.observe(
+                "fifa_dash_response_json_bytes",
+                output,
+                g.get("uncompressed_bytes", size),
+            )
+    return response
+
+
+# Response compression. Bodies of at least FIFA_COMPRESS_MIN_SIZE bytes are
+# compressed with brotli (when the optional brotli package is installed) or
+# gzip, whichever the client accepts. Dash's component bundles never change
+# while the process runs, so each is compressed once. 0 disables compression.
+COMPRESS_MIN_SIZE = int(os.environ.get("FIFA_COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "text/javascript",
+    "text/css",
+    "text/html",
+    "text/plain",
+}
+compressed_assets = {}
+
+
+def compress_body(body, encoding):
+    """Compress ``body`` with ``encoding`` ("br" or "gzip")."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response):
+    """Compress a response body for clients that accept brotli or gzip."""
+    if (
+        COMPRESS_MIN_SIZE <= 0
+        or response.status_code != 200
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if brotli is not None and request.accept_encodings["br"]:
+        encoding = "br"
+    elif request.accept_encodings["gzip"]:
+        encoding = "gzip"
+    else:
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    if "/_dash-component-suites/" in request.path:
+        key = (request.path, encoding)
+        if key not in compressed_assets:
+            compressed_assets[key] = compress_body(body, encoding)
+        compressed = compressed_assets[key]
+    else:
+        compressed = compress_body(body, encoding)
+
+    g.uncompressed_bytes = len(body)
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    # The encoded body is a different representation of the same resource
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def serve_metrics():
+    """Return the metrics and figure cache counters as plain text."""
+    if not METRICS_PUBLIC and request.remote_addr not in ("127.0.0.1", "::1"):
+        return Response("Not found\n", status=404, mimetype="text/plain")
+    lines = [
+        "# HELP fifa_dash_cache_requests_total Figure cache lookups by result.",
+        "# TYPE fifa_dash_cache_requests_total counter",
+    ]
+    for name, builder in (
+        ("nation_dashboard", cached_nation_dashboard),
+        ("skill_dashboard", cached_skill_dashboard),
+    ):
+        info = builder.cache_info()
+        lines.append(
+            f'fifa_dash_cache_requests_total{{cache="{name}",result="hit"}} {info.hits}'
+        )
+        lines.append(
+            f'fifa_dash_cache_requests_total{{cache="{name}",result="miss"}} '
+            f"{info.misses}"
+        )
+    lines += [
+        "# HELP fifa_dash_build_calls_total Figure cache misses by whether they "
+        "built the view or shared an identical build in progress.",
+        "# TYPE fifa_dash_build_calls_total counter",
+    ]
+    for name, builder in (
+        ("nation_dashboard", cached_nation_dashboard),
+        ("skill_dashboard", cached_skill_dashboard),
+    ):
+        flight = builder.__wrapped__
+        lines.append(
+            f'fifa_dash_build_calls_total{{cache="{name}",result="computed"}} '
+            f"{flight.computed}"
+        )
+        lines.append(
+            f'fifa_dash_build_calls_total{{cache="{name}",result="deduplicated"}} '
+            f"{flight.deduplicated}"
+        )
+    return Response(
+        metrics.render() + "\n".join(lines) + "\n",
+        mimetype="text/plain; version=0.0.4",
+    )
+
 
 # Define color scheme
 colors = {
@@ -46,392 +1270,435 @@ colors = {
     "light": "#ecf0f1",
 }
 
-# App layout
-app.layout = html.Div(
-    style={
-        "backgroundColor": colors["background"],
-        "minHeight": "100vh",
-        "fontFamily": "'Segoe UI', 'Roboto', sans-serif",
-        "padding": "20px",
-    },
-    children=[
-        # Header section
-        html.Div(
-            style={
-                "backgroundColor": colors["primary"],
-                "padding": "20px",
-                "borderRadius": "10px",
-                "marginBottom": "20px",
-                "boxShadow": "0 4px 6px rgba(0, 0, 0, 0.1)",
-            },
-            children=[
-                html.H1(
-                    "FIFA 2018 Interactive Dashboard",
-                    style={
-                        "textAlign": "center",
-                        "color": "white",
-                        "marginBottom": "10px",
-                    },
-                ),
-                html.P(
-                    "Explore player statistics, skills, and positions by nationality",
-                    style={
-                        "textAlign": "center",
-                        "color": "white",
-                        "fontSize": "18px",
-                    },
-                ),
-            ],
-        ),
-        # Control section
-        html.Div(
-            style={
-                "backgroundColor": "white",
-                "padding": "20px",
-                "borderRadius": "10px",
-                "marginBottom": "20px",
-                "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-                "display": "flex",
-                "justifyContent": "space-between",
-                "alignItems": "center",
-                "flexWrap": "wrap",
-            },
-            children=[
-                # Dropdown to select nationality
-                html.Div(
-                    [
-                        html.Label(
-                            "Select Nationality:",
-                            style={"fontWeight": "bold", "marginBottom": "8px"},
-                        ),
-                        dcc.Dropdown(
-                            options=[
-                                {"label": nat, "value": nat}
-                                for nat in sorted(df["Nationality"].unique())
-                            ],
-                            value="Brazil",
-                            id="nationality-dropdown",
-                            placeholder="Select a nationality",
-                            style={"width": "300px"},
-                        ),
-                    ],
-                    style={"margin": "10px"},
-                ),
-                # Radio buttons to choose skill
-                html.Div(
-                    [
-                        html.Label(
-                            "Choose Skill to Visualize:",
-                            style={"fontWeight": "bold", "marginBottom": "8px"},
-                        ),
-                        dcc.RadioItems(
-                            options=[
-                                {"label": " Ball Control", "value": "Ball control"},
-                                {"label": " Dribbling", "value": "Dribbling"},
-                                {"label": " Finishing", "value": "Finishing"},
-                                {"label": " Acceleration", "value": "Acceleration"},
-                                {"label": " Aggression", "value": "Aggression"},
-                            ],
-                            value="Dribbling",
-                            inline=True,
-                            id="skill-radio",
-                            labelStyle={
-                                "marginRight": "20px",
-                                "cursor": "pointer",
-                                "padding": "5px 10px",
-                            },
-                        ),
-                    ],
-                    style={"margin": "10px"},
-                ),
-                # Radio buttons for club metric (added for club-performance-chart)
-                html.Div(
-                    [
-                        html.Label(
-                            "Choose Club Metric:",
-                            style={"fontWeight": "bold", "marginBottom": "8px"},
-                        ),
-                        dcc.RadioItems(
-                            options=[
-                                {"label": " Overall Rating", "value": "Overall"},
-                                {"label": " Potential", "value": "Potential"},
-                                {"label": " Age", "value": "Age"},
-                            ],
-                            value="Overall",
-                            inline=True,
-                            id="club-metric-radio",
-                            labelStyle={
-                                "marginRight": "20px",
-                                "cursor": "pointer",
-                                "padding": "5px 10px",
-                            },
-                        ),
-                    ],
-                    style={"margin": "10px"},
-                ),
-            ],
-        ),
-        # Main content section - 2 columns
-        html.Div(
-            style={
-                "display": "flex",
-                "flexWrap": "wrap",
-                "justifyContent": "space-between",
-                "gap": "20px",
-            },
-            children=[
-                # Left column
-                html.Div(
-                    style={
-                        "flex": "1",
-                        "minWidth": "400px",
-                        "backgroundColor": "white",
-                        "padding": "20px",
-                        "borderRadius": "10px",
-                        "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-                    },
-                    children=[
-                        html.H3(
-                            "Top Players by Skill Rating",
-                            style={"color": colors["text"], "marginBottom": "15px"},
-                        ),
-                        dcc.Graph(id="top-players-graph"),
-                    ],
-                ),
-                # Right column
-                html.Div(
-                    style={
-                        "flex": "1",
-                        "minWidth": "400px",
-                        "backgroundColor": "white",
-                        "padding": "20px",
-                        "borderRadius": "10px",
-                        "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-                    },
-                    children=[
-                        html.H3(
-                            "Position Distribution",
-                            style={"color": colors["text"], "marginBottom": "15px"},
-                        ),
-                        dcc.Graph(id="position-pie-chart"),
-                    ],
-                ),
-            ],
-        ),
-        # Age Distribution & Potential Section
-        html.Div(
-            style={
-                "display": "flex",
-                "flexWrap": "wrap",
-                "justifyContent": "space-between",
-                "gap": "20px",
-                "marginTop": "20px",
-            },
-            children=[
-                # Age Distribution
-                html.Div(
-                    style={
-                        "flex": "1",
-                        "minWidth": "400px",
-                        "backgroundColor": "white",
-                        "padding": "20px",
-                        "borderRadius": "10px",
-                        "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-                    },
-                    children=[
-                        html.H3(
-                            "Age Distribution by Nationality",
-                            style={"color": colors["text"], "marginBottom": "15px"},
-                        ),
-                        dcc.Graph(id="age-distribution"),
-                    ],
-                ),
-                # Potential vs Age
-                html.Div(
-                    style={
-                        "flex": "1",
-                        "minWidth": "400px",
-                        "backgroundColor": "white",
-                        "padding": "20px",
-                        "borderRadius": "10px",
-                        "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-                    },
-                    children=[
-                        html.H3(
-                            "Potential vs Age Analysis",
-                            style={"color": colors["text"], "marginBottom": "15px"},
-                        ),
-                        dcc.Graph(id="potential-vs-age"),
-                    ],
-                ),
-            ],
-        ),
-        # Skill Comparison Radar Chart Section
-        html.Div(
-            style={
-                "backgroundColor": "white",
-                "padding": "20px",
-                "borderRadius": "10px",
-                "marginTop": "20px",
-                "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-            },
-            children=[
-                html.H3(
-                    "Player Skill Comparison",
-                    style={"color": colors["text"], "marginBottom": "15px"},
-                ),
-                html.Div(
-                    style={
-                        "display": "flex",
-                        "justifyContent": "space-between",
-                        "flexWrap": "wrap",
-                        "gap": "20px",
-                        "marginBottom": "20px",
-                    },
-                    children=[
-                        html.Div(
-                            style={"flex": "1", "minWidth": "300px"},
-                            children=[
-                                html.Label(
-                                    "Select Player 1:",
-                                    style={
-                                        "fontWeight": "bold",
-                                        "marginBottom": "8px",
-                                        "display": "block",
-                                    },
-                                ),
-                                dcc.Dropdown(
-                                    id="player1-dropdown",
-                                    placeholder="Select player",
-                                ),
-                            ],
-                        ),
-                        html.Div(
-                            style={"flex": "1", "minWidth": "300px"},
-                            children=[
-                                html.Label(
-                                    "Select Player 2:",
-                                    style={
-                                        "fontWeight": "bold",
-                                        "marginBottom": "8px",
-                                        "display": "block",
-                                    },
-                                ),
-                                dcc.Dropdown(
-                                    id="player2-dropdown",
-                                    placeholder="Select player",
-                                ),
-                            ],
-                        ),
-                    ],
-                ),
-                dcc.Graph(id="radar-chart"),
-            ],
-        ),
-        # Players table section
-        html.Div(
-            style={
-                "backgroundColor": "white",
-                "padding": "20px",
-                "borderRadius": "10px",
-                "marginTop": "20px",
-                "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-            },
-            children=[
-                html.H3(
-                    "Players Data",
-                    style={"color": colors["text"], "marginBottom": "15px"},
-                ),
-                dash_table.DataTable(
-                    id="players-table",
-                    page_size=10,
-                    style_table={"overflowX": "auto"},
-                    style_cell={
-                        "textAlign": "left",
-                        "padding": "12px 15px",
-                        "fontFamily": "'Segoe UI', 'Roboto', sans-serif",
-                    },
-                    style_header={
-                        "backgroundColor": colors["light"],
-                        "fontWeight": "bold",
-                        "color": colors["text"],
-                        "borderBottom": "2px solid #ddd",
-                    },
-                    style_data_conditional=[
-                        {
-                            "if": {"row_index": "odd"},
-                            "backgroundColor": "rgb(248, 248, 248)",
-                        }
-                    ],
-                ),
-            ],
-        ),
-        # Skill Correlation Heatmap
-        html.Div(
-            style={
-                "backgroundColor": "white",
-                "padding": "20px",
-                "borderRadius": "10px",
-                "marginTop": "20px",
-                "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
-            },
-            children=[
-                html.H3(
-                    "Skill Correlation Analysis",
-                    style={"color": colors["text"], "marginBottom": "15px"},
-                ),
-                html.P(
-                    "This heatmap shows correlations between different player skills, helping identify which skills tend to develop together.",
-                    style={"marginBottom": "15px"},
-                ),
-                dcc.Graph(id="correlation-heatmap"),
-            ],
-        ),
-        # Footer
-        html.Div(
-            style={
-                "textAlign": "center",
-                "padding": "20px",
-                "marginTop": "20px",
-                "color": colors["text"],
-            },
-            children=[
-                html.P(
-                    "FIFA 2018 Data Analysis Dashboard • Created with Dash and Plotly"
-                ),
-                html.P("© Youssef Taha Badawi — Made with ❤️ in 2025"),
-            ],
-        ),
-    ],
-)
 
+# Skills offered by the skill-radio buttons
+skill_radio_options = [
+    {"label": " Ball Control", "value": "Ball control"},
+    {"label": " Dribbling", "value": "Dribbling"},
+    {"label": " Finishing", "value": "Finishing"},
+    {"label": " Acceleration", "value": "Acceleration"},
+    {"label": " Aggression", "value": "Aggression"},
+]
 
-# Callbacks to update table and charts based on nationality and skill
-@callback(
-    [
-        Output("players-table", "data"),
-        Output("top-players-graph", "figure"),
-        Output("position-pie-chart", "figure"),
-        Output("player1-dropdown", "options"),
-        Output("player2-dropdown", "options"),
-        Output("player1-dropdown", "value"),
-        Output("player2-dropdown", "value"),
-        Output("age-distribution", "figure"),
-        Output("potential-vs-age", "figure"),
-        Output("correlation-heatmap", "figure"),
-    ],
-    [Input("nationality-dropdown", "value"), Input("skill-radio", "value")],
-)
-def update_main_dashboard(selected_nat, selected_skill):
-    # Filter data by nationality
-    filtered_df = df[df["Nationality"] == selected_nat].copy()
 
-    # Ensure skill column is numeric
-    filtered_df[selected_skill] = pd.to_numeric(
-        filtered_df[selected_skill], errors="coerce"
+# App layout, rebuilt on each page load from the current dataset
+def serve_layout(data):
+    return html.Div(
+        style={
+            "backgroundColor": colors["background"],
+            "minHeight": "100vh",
+            "fontFamily": "'Segoe UI', 'Roboto', sans-serif",
+            "padding": "20px",
+        },
+        children=[
+            # Header section
+            html.Div(
+                style={
+                    "backgroundColor": colors["primary"],
+                    "padding": "20px",
+                    "borderRadius": "10px",
+                    "marginBottom": "20px",
+                    "boxShadow": "0 4px 6px rgba(0, 0, 0, 0.1)",
+                },
+                children=[
+                    html.H1(
+                        "FIFA 2018 Interactive Dashboard",
+                        style={
+                            "textAlign": "center",
+                            "color": "white",
+                            "marginBottom": "10px",
+                        },
+                    ),
+                    html.P(
+                        "Explore player statistics, skills, and positions by nationality",
+                        style={
+                            "textAlign": "center",
+                            "color": "white",
+                            "fontSize": "18px",
+                        },
+                    ),
+                ],
+            ),
+            # Control section
+            html.Div(
+                style={
+                    "backgroundColor": "white",
+                    "padding": "20px",
+                    "borderRadius": "10px",
+                    "marginBottom": "20px",
+                    "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                    "display": "flex",
+                    "justifyContent": "space-between",
+                    "alignItems": "center",
+                    "flexWrap": "wrap",
+                },
+                children=[
+                    # Dropdown to select nationality
+                    html.Div(
+                        [
+                            html.Label(
+                                "Select Nationality:",
+                                style={"fontWeight": "bold", "marginBottom": "8px"},
+                            ),
+                            dcc.Dropdown(
+                                options=[
+                                    {"label": nat, "value": nat}
+                                    for nat in data.nationalities
+                                ],
+                                value="Brazil",
+                                id="nationality-dropdown",
+                                placeholder="Select a nationality",
+                                style={"width": "300px"},
+                            ),
+                        ],
+                        style={"margin": "10px"},
+                    ),
+                    # Radio buttons to choose skill
+                    html.Div(
+                        [
+                            html.Label(
+                                "Choose Skill to Visualize:",
+                                style={"fontWeight": "bold", "marginBottom": "8px"},
+                            ),
+                            dcc.RadioItems(
+                                options=skill_radio_options,
+                                value="Dribbling",
+                                inline=True,
+                                id="skill-radio",
+                                labelStyle={
+                                    "marginRight": "20px",
+                                    "cursor": "pointer",
+                                    "padding": "5px 10px",
+                                },
+                            ),
+                        ],
+                        style={"margin": "10px"},
+                    ),
+                    # Radio buttons for club metric (added for club-performance-chart)
+                    html.Div(
+                        [
+                            html.Label(
+                                "Choose Club Metric:",
+                                style={"fontWeight": "bold", "marginBottom": "8px"},
+                            ),
+                            dcc.RadioItems(
+                                options=[
+                                    {"label": " Overall Rating", "value": "Overall"},
+                                    {"label": " Potential", "value": "Potential"},
+                                    {"label": " Age", "value": "Age"},
+                                ],
+                                value="Overall",
+                                inline=True,
+                                id="club-metric-radio",
+                                labelStyle={
+                                    "marginRight": "20px",
+                                    "cursor": "pointer",
+                                    "padding": "5px 10px",
+                                },
+                            ),
+                        ],
+                        style={"margin": "10px"},
+                    ),
+                ],
+            ),
+            # Main content section - 2 columns
+            html.Div(
+                style={
+                    "display": "flex",
+                    "flexWrap": "wrap",
+                    "justifyContent": "space-between",
+                    "gap": "20px",
+                },
+                children=[
+                    # Left column
+                    html.Div(
+                        style={
+                            "flex": "1",
+                            "minWidth": "400px",
+                            "backgroundColor": "white",
+                            "padding": "20px",
+                            "borderRadius": "10px",
+                            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                        },
+                        children=[
+                            html.H3(
+                                "Top Players by Skill Rating",
+                                style={"color": colors["text"], "marginBottom": "15px"},
+                            ),
+                            dcc.Graph(id="top-players-graph"),
+                        ],
+                    ),
+                    # Right column
+                    html.Div(
+                        style={
+                            "flex": "1",
+                            "minWidth": "400px",
+                            "backgroundColor": "white",
+                            "padding": "20px",
+                            "borderRadius": "10px",
+                            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                        },
+                        children=[
+                            html.H3(
+                                "Position Distribution",
+                                style={"color": colors["text"], "marginBottom": "15px"},
+                            ),
+                            dcc.Graph(id="position-pie-chart"),
+                        ],
+                    ),
+                ],
+            ),
+            # Age Distribution & Potential Section
+            html.Div(
+                style={
+                    "display": "flex",
+                    "flexWrap": "wrap",
+                    "justifyContent": "space-between",
+                    "gap": "20px",
+                    "marginTop": "20px",
+                },
+                children=[
+                    # Age Distribution
+                    html.Div(
+                        style={
+                            "flex": "1",
+                            "minWidth": "400px",
+                            "backgroundColor": "white",
+                            "padding": "20px",
+                            "borderRadius": "10px",
+                            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                        },
+                        children=[
+                            html.H3(
+                                "Age Distribution by Nationality",
+                                style={"color": colors["text"], "marginBottom": "15px"},
+                            ),
+                            dcc.Graph(id="age-distribution"),
+                        ],
+                    ),
+                    # Potential vs Age
+                    html.Div(
+                        style={
+                            "flex": "1",
+                            "minWidth": "400px",
+                            "backgroundColor": "white",
+                            "padding": "20px",
+                            "borderRadius": "10px",
+                            "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                        },
+                        children=[
+                            html.H3(
+                                "Potential vs Age Analysis",
+                                style={"color": colors["text"], "marginBottom": "15px"},
+                            ),
+                            dcc.Graph(id="potential-vs-age"),
+                        ],
+                    ),
+                ],
+            ),
+            # Skill Comparison Radar Chart Section
+            html.Div(
+                style={
+                    "backgroundColor": "white",
+                    "padding": "20px",
+                    "borderRadius": "10px",
+                    "marginTop": "20px",
+                    "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                },
+                children=[
+                    html.H3(
+                        "Player Skill Comparison",
+                        style={"color": colors["text"], "marginBottom": "15px"},
+                    ),
+                    html.Div(
+                        style={
+                            "display": "flex",
+                            "justifyContent": "space-between",
+                            "flexWrap": "wrap",
+                            "gap": "20px",
+                            "marginBottom": "20px",
+                        },
+                        children=[
+                            html.Div(
+                                style={"flex": "1", "minWidth": "300px"},
+                                children=[
+                                    html.Label(
+                                        "Select Player 1:",
+                                        style={
+                                            "fontWeight": "bold",
+                                            "marginBottom": "8px",
+                                            "display": "block",
+                                        },
+                                    ),
+                                    dcc.Dropdown(
+                                        id="player1-dropdown",
+                                        placeholder="Select player",
+                                    ),
+                                ],
+                            ),
+                            html.Div(
+                                style={"flex": "1", "minWidth": "300px"},
+                                children=[
+                                    html.Label(
+                                        "Select Player 2:",
+                                        style={
+                                            "fontWeight": "bold",
+                                            "marginBottom": "8px",
+                                            "display": "block",
+                                        },
+                                    ),
+                                    dcc.Dropdown(
+                                        id="player2-dropdown",
+                                        placeholder="Select player",
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                    dcc.Graph(id="radar-chart"),
+                ],
+            ),
+            # Players table section
+            html.Div(
+                style={
+                    "backgroundColor": "white",
+                    "padding": "20px",
+                    "borderRadius": "10px",
+                    "marginTop": "20px",
+                    "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                },
+                children=[
+                    html.H3(
+                        "Players Data",
+                        style={"color": colors["text"], "marginBottom": "15px"},
+                    ),
+                    dash_table.DataTable(
+                        id="players-table",
+                        # Paging, sorting and filtering run on the server so only
+                        # the visible page is sent to the browser
+                        page_current=0,
+                        page_size=10,
+                        page_action="custom",
+                        sort_action="custom",
+                        sort_mode="multi",
+                        sort_by=[],
+                        filter_action="custom",
+                        filter_query="",
+                        style_table={"overflowX": "auto"},
+                        style_cell={
+                            "textAlign": "left",
+                            "padding": "12px 15px",
+                            "fontFamily": "'Segoe UI', 'Roboto', sans-serif",
+                        },
+                        style_header={
+                            "backgroundColor": colors["light"],
+                            "fontWeight": "bold",
+                            "color": colors["text"],
+                            "borderBottom": "2px solid #ddd",
+                        },
+                        style_data_conditional=[
+                            {
+                                "if": {"row_index": "odd"},
+                                "backgroundColor": "rgb(248, 248, 248)",
+                            }
+                        ],
+                    ),
+                ],
+            ),
+            # Skill Correlation Heatmap
+            html.Div(
+                style={
+                    "backgroundColor": "white",
+                    "padding": "20px",
+                    "borderRadius": "10px",
+                    "marginTop": "20px",
+                    "boxShadow": "0 2px 4px rgba(0, 0, 0, 0.05)",
+                },
+                children=[
+                    html.H3(
+                        "Skill Correlation Analysis",
+                        style={"color": colors["text"], "marginBottom": "15px"},
+                    ),
+                    html.P(
+                        "This heatmap shows correlations between different player skills, helping identify which skills tend to develop together.",
+                        style={"marginBottom": "15px"},
+                    ),
+                    dcc.Graph(id="correlation-heatmap"),
+                ],
+            ),
+            # Footer
+            html.Div(
+                style={
+                    "textAlign": "center",
+                    "padding": "20px",
+                    "marginTop": "20px",
+                    "color": colors["text"],
+                },
+                children=[
+                    html.P(
+                        "FIFA 2018 Data Analysis Dashboard • Created with Dash and Plotly"
+                    ),
+                    html.P("© Youssef Taha Badawi — Made with ❤️ in 2025"),
+                ],
+            ),
+        ],
+    )
+
+
+# Callbacks to update the nationality views. None of these depend on the
+# selected skill, so toggling skill-radio does not recompute them.
+@timed("fifa_dash_callback_seconds", "update_nation_dashboard")
+def update_nation_dashboard(data, selected_nat):
+    return cached_nation_dashboard(data.generation, selected_nat)
+
+
+# Player dropdown options: the players matching the typed search text, from
+# any nationality, plus the selected player so its label shows
+@timed("fifa_dash_callback_seconds", "update_player_options")
+def update_player_options(data, search_value, value):
+    options = [player_option(value)] if value else []
+    for nationality, name in data.player_index.search(search_value):
+        key = player_key(nationality, name)
+        if key != value:
+            options.append(player_option(key))
+    return options
+
+
+# Callback to update the top players chart, the only figure that depends on
+# the selected skill
+@timed("fifa_dash_callback_seconds", "update_skill_dashboard")
+def update_skill_dashboard(data, selected_nat, selected_skill):
+    return cached_skill_dashboard(data.generation, selected_nat, selected_skill)
+
+
+# Callback to serve one page of the players table. Changing the nationality,
+# skill, sort order or filter jumps back to the first page.
+@timed("fifa_dash_callback_seconds", "update_players_table")
+def update_players_table(
+    data, selected_nat, selected_skill, page_current, page_size, sort_by, filter_query
+):
+    if "players-table.page_current" not in ctx.triggered_prop_ids:
+        page_current = 0
+    return query_players_table(
+        data,
+        selected_nat,
+        selected_skill,
+        page_current,
+        page_size,
+        sort_by,
+        filter_query,
     )
 
-    # Prepare table data
+
+@timed("fifa_dash_stage_seconds", "table")
+def query_players_table(
+    data, selected_nat, selected_skill, page_current, page_size, sort_by, filter_query
+):
+    """Filter, sort and page a nation's players for the players table."""
+    page_current = page_current or 0
+    page_size = page_size or 10
+
+    # Table columns for the selected skill
     table_columns = [
         "Name",
         "Club",
@@ -441,91 +1708,272 @@ def update_main_dashboard(selected_nat, selected_skill):
         "Preferred Positions",
         selected_skill,
     ]
-    table_data = (
-        filtered_df[table_columns]
-        .sort_values(by=selected_skill, ascending=False)
-        .to_dict("records")
-    )
+    nation_df = data.nation_df(selected_nat)
+    mask = filter_table_mask(nation_df, filter_query, table_columns)
 
-    # Prepare bar chart for top players
-    top_players = filtered_df.sort_values(by=selected_skill, ascending=False).head(10)
+    # Order the matching rows by the requested columns, or by the selected
+    # skill using the nation's precomputed ordering. Only the rows of the
+    # requested page are copied out of the nation's frame.
+    if sort_by:
+        sort_by = [s for s in sort_by if s["column_id"] in table_columns]
+    if sort_by:
+        rows = np.flatnonzero(mask)
+        sort_df = nation_df[[s["column_id"] for s in sort_by]].iloc[rows]
+        sort_df = sort_df.reset_index(drop=True).sort_values(
+            by=[s["column_id"] for s in sort_by],
+            ascending=[s["direction"] == "asc" for s in sort_by],
+            kind="stable",
+        )
+        rows = rows[sort_df.index.to_numpy()]
+    else:
+        order = data.skill_order(selected_nat, selected_skill)
+        rows = order[mask[order]]
 
-    bar_fig = px.bar(
-        top_players,
-        x="Name",
-        y=selected_skill,
-        color="Club",
-        title=f"Top 10 Players by {selected_skill} in {selected_nat}",
-        color_discrete_sequence=px.colors.qualitative.Set3,
-    )
+    page_count = max(1, -(-len(rows) // page_size))
+    page_current = min(page_current, page_count - 1)
+    start = page_current * page_size
+    columns = [
+        {
+            "name": col,
+            "id": col,
+            "type": (
+                "numeric" if pd.api.types.is_numeric_dtype(nation_df[col]) else "text"
+            ),
+        }
+        for col in table_columns
+    ]
 
-    bar_fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=20, r=20, t=60, b=20),
-        xaxis=dict(
-            title="Player Name",
-            tickangle=-45,
-            tickfont=dict(size=10),
+    return (
+        nation_df.iloc[rows[start : start + page_size]][table_columns].to_dict(
+            "records"
         ),
-        yaxis=dict(title=f"{selected_skill} Rating"),
-        legend_title="Club",
-        height=450,
+        columns,
+        page_count,
+        page_current,
     )
 
-    # Prepare pie chart for positions
-    positions = []
-    for pos in (
-        filtered_df["Preferred Positions"].fillna("Unknown").astype(str).str.split(" ")
-    ):
-        if isinstance(pos, list):
-            positions.extend(pos)
+
+# Filter expressions written by DataTable's custom filter UI, such as
+# "{Age} s< 25 && {Club} icontains Madrid"
+FILTER_PART_PATTERN = re.compile(
+    r"\{(?P<column>[^}]+)\}\s*(?P<case>[si]?)"
+    r"(?P<operator>>=|<=|!=|>|<|=|eq|ne|lt|le|gt|ge|contains|datestartswith)"
+    r"\s*(?P<value>.*)"
+)
+
+FILTER_OPERATORS = {
+    ">=": "ge",
+    "<=": "le",
+    "!=": "ne",
+    ">": "gt",
+    "<": "lt",
+    "=": "eq",
+}
+
+
+def parse_filter_query(filter_query):
+    """Split a DataTable filter query into its conditions.
+
+    Each condition is a (column, operator, text, number, case) tuple. ``text``
+    is the value as written, without quotes, and ``number`` its numeric value
+    (None for quoted or non-numeric values), so text operators and text
+    columns can match "22" as typed rather than as "22.0".
+    """
+    parts = []
+    for part in (filter_query or "").split(" && "):
+        match = FILTER_PART_PATTERN.match(part.strip())
+        if not match:
+            continue
+        text = match["value"].strip()
+        number = None
+        if len(text) > 1 and text[0] == text[-1] and text[0] in "'\"`":
+            text = text[1:-1].replace("\\" + text[0], text[0])
         else:
-            positions.append(pos)
+            try:
+                number = float(text)
+            except ValueError:
+                pass
+        operator = FILTER_OPERATORS.get(match["operator"], match["operator"])
+        parts.append((match["column"], operator, text, number, match["case"] != "i"))
+    return parts
+
+
+def filter_table_mask(frame, filter_query, columns=None):
+    """Return the rows of a frame matching a DataTable filter query as a mask.
+
+    Conditions on columns outside ``columns`` (default: all of the frame's)
+    are ignored.
+    """
+    columns = frame.columns if columns is None else columns
+    mask = np.ones(len(frame), dtype=bool)
+    for column, operator, value, number, case in parse_filter_query(filter_query):
+        if column not in columns or column not in frame.columns:
+            continue
+        series = frame[column]
+        if operator in ("contains", "datestartswith"):
+            text = series.astype(str)
+            if operator == "contains":
+                matches = text.str.contains(value, case=case, regex=False)
+            else:
+                matches = text.str.startswith(value)
+        elif pd.api.types.is_numeric_dtype(series):
+            if number is None:
+                matches = pd.Series(False, index=series.index)
+            else:
+                matches = getattr(series, operator)(number)
+        else:
+            text = series.astype(str)
+            if not case:
+                text, value = text.str.lower(), value.lower()
+            matches = getattr(text, operator)(value)
+        mask &= matches.fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def filter_table_rows(frame, filter_query):
+    """Apply a DataTable filter query to a frame with vectorized comparisons."""
+    return frame[filter_table_mask(frame, filter_query)]
+
 
-    position_counts = pd.Series(positions).value_counts().reset_index()
-    position_counts.columns = ["Position", "Count"]
+# The prepared data is read-only, so the outputs of both figure callbacks are
+# memoized per (dataset generation, input). The key holds the generation
+# number rather than the data, so a view cached for a replaced dataset (even
+# one a slow request adds after the reload cleared the cache) does not keep
+# that dataset in memory. cache_info() on each cache reports hits and misses.
+# Concurrent misses for the same view, such as many users opening a shared
+# link at once, are coalesced into one build by SingleFlight.
+@functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+@SingleFlight
+def cached_nation_dashboard(generation, selected_nat):
+    return build_nation_dashboard(live_datasets[generation], selected_nat)
 
-    pie_fig = px.pie(
-        position_counts,
-        names="Position",
-        values="Count",
-        title=f"Position Distribution - {selected_nat}",
-        color_discrete_sequence=px.colors.qualitative.Bold,
-        hole=0.3,
+
+@functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+@SingleFlight
+def cached_skill_dashboard(generation, selected_nat, selected_skill):
+    return build_skill_dashboard(
+        live_datasets[generation], selected_nat, selected_skill
     )
 
-    pie_fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=20, r=20, t=60, b=20),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.3,
-            xanchor="center",
-            x=0.5,
+
+def build_nation_dashboard(data, selected_nat):
+    # Look up the nationality partition
+    filtered_df = data.nation_df(selected_nat)
+
+    # Default players for the player dropdowns, whose options are searched
+    names = filtered_df["Name"]
+    player1_default = player_key(selected_nat, names.iloc[0]) if len(names) else None
+    player2_default = (
+        player_key(selected_nat, names.iloc[1]) if len(names) > 1 else None
+    )
+
+    return (
+        make_position_pie(data, selected_nat),
+        player1_default,
+        player2_default,
+        make_age_histogram(filtered_df, selected_nat),
+        make_potential_age_scatter(filtered_df, selected_nat),
+        make_correlation_heatmap(data, selected_nat),
+    )
+
+
+def build_skill_dashboard(data, selected_nat, selected_skill):
+    return make_top_players_bar(data, selected_nat, selected_skill)
+
+
+@timed("fifa_dash_stage_seconds", "top_players_bar")
+def make_top_players_bar(data, selected_nat, selected_skill):
+    # Prepare bar chart for the first ten players of the nation's precomputed
+    # ordering, one trace (and legend entry) per club in order of appearance,
+    # as plotly express colors them
+    top_players = data.nation_df(selected_nat).take(
+        data.skill_order(selected_nat, selected_skill)[:10]
+    )
+    names = top_players["Name"].to_numpy(dtype=object)
+    values = numeric_values(top_players[selected_skill])
+    codes, clubs = pd.factorize(top_players["Club"].astype(object))
+    palette = px.colors.qualitative.Set3
+
+    traces = []
+    for code, club in enumerate(clubs):
+        rows = codes == code
+        traces.append(
+            {
+                "type": "bar",
+                "x": names[rows].tolist(),
+                "y": typed_array(values[rows]),
+                "name": club,
+                "legendgroup": club,
+                "showlegend": True,
+                "marker": {"color": palette[code % len(palette)]},
+                "hovertemplate": (
+                    f"Club={club}<br>Name=%{{x}}<br>{selected_skill}=%{{y}}"
+                    "<extra></extra>"
+                ),
+            }
+        )
+
+    return make_figure(
+        traces,
+        figure_layout(
+            f"Top 10 Players by {selected_skill} in {selected_nat}",
+            xaxis=axis_layout("Player Name", tickangle=-45, tickfont={"size": 10}),
+            yaxis=axis_layout(f"{selected_skill} Rating"),
+            legend={"title": {"text": "Club"}, "tracegroupgap": 0},
+            barmode="relative",
         ),
-        height=450,
     )
 
-    pie_fig.update_traces(
-        textposition="inside",
-        textinfo="percent+label",
-        insidetextfont=dict(color="white"),
-        hoverinfo="label+percent+value",
-        marker=dict(line=dict(color="white", width=2)),
+
+@timed("fifa_dash_stage_seconds", "position_pie")
+def make_position_pie(data, selected_nat):
+    # Prepare pie chart for positions from the precomputed counts
+    if selected_nat in data.position_counts.index:
+        nation_counts = data.position_counts.loc[selected_nat]
+        nation_counts = nation_counts[nation_counts > 0].sort_values(
+            ascending=False, kind="stable"
+        )
+    else:
+        nation_counts = pd.Series(dtype="int64")
+
+    pie_trace = {
+        "type": "pie",
+        "labels": nation_counts.index.tolist(),
+        "values": typed_array(nation_counts.to_numpy()),
+        "hole": 0.3,
+        "textposition": "inside",
+        "textinfo": "percent+label",
+        "insidetextfont": {"color": "white"},
+        "hoverinfo": "label+percent+value",
+        "hovertemplate": "Position=%{label}<br>Count=%{value}<extra></extra>",
+        "marker": {"line": {"color": "white", "width": 2}},
+    }
+
+    return make_figure(
+        [pie_trace],
+        figure_layout(
+            f"Position Distribution - {selected_nat}",
+            legend={
+                "orientation": "h",
+                "yanchor": "bottom",
+                "y": -0.3,
+                "xanchor": "center",
+                "x": 0.5,
+                "tracegroupgap": 0,
+            },
+            piecolorway=px.colors.qualitative.Bold,
+        ),
     )
 
-    # Player dropdown options
-    player_options = [
-        {"label": name, "value": name} for name in filtered_df["Name"].sort_values()
-    ]
 
-    # Set default values for player dropdowns
-    player1_default = filtered_df["Name"].iloc[0] if not filtered_df.empty else None
-    player2_default = filtered_df["Name"].iloc[1] if len(filtered_df) > 1 else None
+@timed("fifa_dash_stage_seconds", "age_histogram")
+def make_age_histogram(filtered_df, selected_nat):
+    if AGE_HISTOGRAM_MODE == "raw":
+        return make_raw_age_histogram(filtered_df, selected_nat)
+    return make_binned_age_histogram(filtered_df, selected_nat)
+
 
+def make_raw_age_histogram(filtered_df, selected_nat):
     # Age distribution histogram
     age_fig = px.histogram(
         filtered_df,
@@ -535,7 +1983,7 @@ def update_main_dashboard(selected_nat, selected_skill):
         opacity=0.7,
         marginal="box",
         color_discrete_sequence=px.colors.qualitative.Pastel,
-        nbins=25,
+        nbins=AGE_HISTOGRAM_BINS,
     )
 
     age_fig.update_layout(
@@ -548,208 +1996,362 @@ def update_main_dashboard(selected_nat, selected_skill):
         height=450,
     )
 
-    # Potential vs Age scatter plot
-    potential_age_fig = px.scatter(
-        filtered_df,
-        x="Age",
-        y="Potential",
-        color="Overall",
-        size="Overall",
-        hover_name="Name",
-        hover_data=["Club", "Preferred Positions"],
-        title=f"Potential vs Age - {selected_nat}",
-        color_continuous_scale="Viridis",
+    # Cache the figure as a plain dict with its arrays already base64 encoded,
+    # so plotly does not validate and re-encode it on every response
+    return age_fig.to_plotly_json()
+
+
+def get_age_histogram_stats(filtered_df):
+    """Bin ages per preferred position and summarize each position.
+
+    A player counts once for every position they list, as in the position
+    pie, so the figure has one group per position rather than one per
+    distinct positions string. Returns the position names (most common
+    first), the bin centers and width, a positions x bins count matrix, and a
+    frame with the box plot statistics of every position.
+    """
+    ages = filtered_df["Age"].to_numpy(dtype="float64", na_value=np.nan)
+    positions = filtered_df["Preferred Positions"].astype(object).fillna("Unknown")
+    valid = ~np.isnan(ages)
+    ages = ages[valid]
+
+    # Split each distinct positions string once, then repeat every player's
+    # age for each of their positions
+    combos, combo_names = pd.factorize(positions.to_numpy()[valid])
+    tokens = split_positions(combo_names)
+    position_codes, names = pd.factorize(tokens.to_numpy())
+    combo_sizes = tokens.groupby(level=0).size().to_numpy()
+    combo_starts = np.cumsum(combo_sizes) - combo_sizes
+    row_sizes = combo_sizes[combos]
+    rows = np.repeat(np.arange(len(ages)), row_sizes)
+    within = np.arange(len(rows)) - np.repeat(
+        np.cumsum(row_sizes) - row_sizes, row_sizes
     )
+    codes = position_codes[combo_starts[combos[rows]] + within]
+    ages = ages[rows]
 
-    potential_age_fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=20, r=20, t=60, b=20),
-        xaxis=dict(title="Age"),
-        yaxis=dict(title="Potential Rating"),
-        height=450,
+    # Most common positions first, like the slices of the position pie
+    order = np.argsort(-np.bincount(codes, minlength=len(names)), kind="stable")
+    codes = np.argsort(order)[codes]
+    names = names[order]
+    if not len(ages):
+        return names, np.array([]), 1, np.zeros((0, 0), dtype=int), pd.DataFrame()
+
+    # Integer-width bins centered on whole ages, at most AGE_HISTOGRAM_BINS
+    start = math.floor(ages.min())
+    width = max(1, math.ceil((ages.max() - start + 1) / AGE_HISTOGRAM_BINS))
+    bins = ((ages - start) // width).astype(int)
+    nbins = bins.max() + 1
+    counts = np.bincount(codes * nbins + bins, minlength=len(names) * nbins).reshape(
+        len(names), nbins
     )
+    centers = start + width * np.arange(nbins) + (width - 1) / 2
 
-    # Correlation heatmap
-    corr_columns = [
-        "Overall",
-        "Potential",
-        "Ball control",
-        "Dribbling",
-        "Finishing",
-        "Acceleration",
-        "Aggression",
-        "Agility",
-        "Balance",
-        "Composure",
-        "Strength",
-    ]
+    # Quartiles, and whiskers at the furthest ages within 1.5 IQR
+    grouped = pd.Series(ages).groupby(codes)
+    box = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    box.columns = ["q1", "median", "q3"]
+    iqr = box["q3"] - box["q1"]
+    low = (box["q1"] - 1.5 * iqr).to_numpy()[codes]
+    high = (box["q3"] + 1.5 * iqr).to_numpy()[codes]
+    inside = pd.Series(np.where((ages >= low) & (ages <= high), ages, np.nan))
+    box["lowerfence"] = inside.groupby(codes).min()
+    box["upperfence"] = inside.groupby(codes).max()
+    return names, centers, width, counts, box
 
-    # Filter out columns not in the dataframe
-    available_columns = [col for col in corr_columns if col in filtered_df.columns]
 
-    # Create correlation matrix
-    corr_matrix = filtered_df[available_columns].corr()
+def make_binned_age_histogram(filtered_df, selected_nat):
+    # Age distribution histogram from server-side bins, with a box per
+    # position above it, as in a plotly express marginal box
+    names, centers, width, counts, box = get_age_histogram_stats(filtered_df)
+    palette = px.colors.qualitative.Pastel
 
-    # Create heatmap
-    heatmap_fig = go.Figure(
-        data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
-            colorscale="YlGnBu",
-            colorbar=dict(title="Correlation"),
-            hovertemplate="%{y} vs %{x}<br>Correlation: %{z:.2f}<extra></extra>",
+    traces = []
+    for code, name in enumerate(names):
+        color = palette[code % len(palette)]
+        filled = counts[code] > 0
+        stats = box.loc[code]
+        traces.append(
+            {
+                "type": "bar",
+                "x": typed_array(centers[filled].astype("float32")),
+                "y": typed_array(counts[code][filled]),
+                "width": width,
+                "name": name,
+                "legendgroup": name,
+                "marker": {"color": color},
+                "opacity": 0.7,
+                "hovertemplate": "Age=%{x}<br>count=%{y}",
+            }
+        )
+        traces.append(
+            {
+                "type": "box",
+                "y": [name],
+                "q1": [stats["q1"]],
+                "median": [stats["median"]],
+                "q3": [stats["q3"]],
+                "lowerfence": [stats["lowerfence"]],
+                "upperfence": [stats["upperfence"]],
+                "orientation": "h",
+                "name": name,
+                "legendgroup": name,
+                "showlegend": False,
+                "marker": {"color": color},
+                "xaxis": "x2",
+                "yaxis": "y2",
+            }
         )
+
+    return make_figure(
+        traces,
+        figure_layout(
+            f"Age Distribution - {selected_nat}",
+            barmode="relative",
+            bargap=0,
+            xaxis=axis_layout("Age", domain=[0, 1]),
+            yaxis=axis_layout("Count", domain=[0, 0.7326]),
+            xaxis2={
+                "matches": "x",
+                "anchor": "y2",
+                "showticklabels": False,
+                "showgrid": True,
+            },
+            yaxis2={
+                "domain": [0.7426, 1],
+                "matches": None,
+                "showticklabels": False,
+                "showline": False,
+            },
+            legend={"title": {"text": "Position"}},
+        ),
     )
 
-    heatmap_fig.update_layout(
-        title=f"Skill Correlation Heatmap - {selected_nat}",
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=20, r=20, t=60, b=20),
-        height=600,
+
+@timed("fifa_dash_stage_seconds", "potential_age_scatter")
+def make_potential_age_scatter(filtered_df, selected_nat):
+    # Potential vs Age scatter plot, one marker per player colored and sized by
+    # the overall rating (markers at most 20px across, as in plotly express)
+    if 0 < SCATTER_AGGREGATE_THRESHOLD < len(filtered_df):
+        return make_aggregated_potential_age_scatter(filtered_df, selected_nat)
+
+    ages, potentials, overalls = (
+        numeric_values(filtered_df[col]) for col in ("Age", "Potential", "Overall")
     )
+    largest = np.nanmax(overalls) if np.isfinite(overalls).any() else 1.0
+    hover_data = ["Club", "Preferred Positions"]
 
-    return (
-        table_data,
-        bar_fig,
-        pie_fig,
-        player_options,
-        player_options,
-        player1_default,
-        player2_default,
-        age_fig,
-        potential_age_fig,
-        heatmap_fig,
+    scatter_trace = {
+        "type": (
+            "scattergl" if len(filtered_df) > SCATTER_WEBGL_THRESHOLD else "scatter"
+        ),
+        "mode": "markers",
+        "x": typed_array(ages),
+        "y": typed_array(potentials),
+        "hovertext": filtered_df["Name"].to_numpy(dtype=object).tolist(),
+        "customdata": filtered_df[hover_data].to_numpy(dtype=object).tolist(),
+        "marker": {
+            "color": typed_array(overalls),
+            "coloraxis": "coloraxis",
+            "size": typed_array(overalls),
+            "sizemode": "area",
+            "sizeref": largest / 20**2,
+            "symbol": "circle",
+        },
+        "showlegend": False,
+        "hovertemplate": (
+            "<b>%{hovertext}</b><br><br>Age=%{x}<br>Potential=%{y}"
+            "<br>Overall=%{marker.color}<br>Club=%{customdata[0]}"
+            "<br>Preferred Positions=%{customdata[1]}<extra></extra>"
+        ),
+    }
+
+    return make_figure(
+        [scatter_trace],
+        figure_layout(
+            f"Potential vs Age - {selected_nat}",
+            xaxis=axis_layout("Age"),
+            yaxis=axis_layout("Potential Rating"),
+            coloraxis={
+                "colorscale": COLORSCALES["Viridis"],
+                "colorbar": {"title": {"text": "Overall"}},
+            },
+            legend={"tracegroupgap": 0, "itemsizing": "constant"},
+        ),
     )
 
 
-@callback(
-    Output("overall-skill-chart", "figure"),
-    Input("overall-skill-radio", "value"),
-)
-def update_overall_chart(selected_skill):
-    # Convert skill column to numeric, forcing errors to NaN
-    df[selected_skill] = pd.to_numeric(df[selected_skill], errors="coerce")
+def make_aggregated_potential_age_scatter(filtered_df, selected_nat):
+    # One WebGL marker per (Age, Potential) pair, sized by the number of
+    # players (at most 30px across) and colored by their average overall
+    # rating. Compact UInt8 ratings are grouped as floats.
+    points = (
+        filtered_df.astype(
+            {
+                col: "float64"
+                for col in numeric_columns
+                if filtered_df[col].dtype == "UInt8"
+            }
+        )
+        .groupby(["Age", "Potential"])["Overall"]
+        .agg(["size", "mean"])
+        .reset_index()
+    )
+    sizes = points["size"].to_numpy()
+    means = points["mean"].to_numpy()
+
+    scatter_trace = {
+        "type": "scattergl",
+        "mode": "markers",
+        "x": typed_array(points["Age"].to_numpy()),
+        "y": typed_array(points["Potential"].to_numpy()),
+        "customdata": typed_array(np.column_stack([sizes, means])),
+        "marker": {
+            "size": typed_array(sizes),
+            "sizemode": "area",
+            "sizeref": sizes.max() / 30**2 if len(sizes) else 1.0,
+            "sizemin": 3,
+            "color": typed_array(means),
+            "coloraxis": "coloraxis",
+        },
+        "hovertemplate": (
+            "Age=%{x}<br>Potential=%{y}<br>Players=%{customdata[0]}"
+            "<br>Average Overall=%{customdata[1]:.1f}<extra></extra>"
+        ),
+    }
+
+    return make_figure(
+        [scatter_trace],
+        figure_layout(
+            f"Potential vs Age - {selected_nat} ({len(filtered_df)} players)",
+            coloraxis={
+                "colorscale": COLORSCALES["Viridis"],
+                "colorbar": {"title": {"text": "Average Overall"}},
+            },
+            xaxis=axis_layout("Age"),
+            yaxis=axis_layout("Potential Rating"),
+        ),
+    )
+
 
-    # Group by nationality and calculate average skill
+@timed("fifa_dash_stage_seconds", "correlation_heatmap")
+def make_correlation_heatmap(data, selected_nat):
+    # Look up the precomputed correlation matrix
+    store = data.correlation_store
+    corr_matrix = store.correlation(selected_nat)
+    if corr_matrix is None:
+        corr_matrix = pd.DataFrame(np.nan, index=store.columns, columns=store.columns)
+
+    # Create heatmap
+    heatmap_trace = {
+        "type": "heatmap",
+        "z": typed_array(corr_matrix.to_numpy()),
+        "x": store.columns,
+        "y": store.columns,
+        "colorscale": COLORSCALES["YlGnBu"],
+        "colorbar": {"title": {"text": "Correlation"}},
+        "hovertemplate": "%{y} vs %{x}<br>Correlation: %{z:.2f}<extra></extra>",
+    }
+
+    return make_figure(
+        [heatmap_trace],
+        figure_layout(f"Skill Correlation Heatmap - {selected_nat}", height=600),
+    )
+
+
+@timed("fifa_dash_callback_seconds", "update_overall_chart")
+def update_overall_chart(data, selected_skill):
+    # Average skill per nationality, read from the aggregate cube
     skill_by_nation = (
-        df.groupby("Nationality")[selected_skill]
-        .mean()
+        data.aggregate_cube.stats("nationality", selected_skill)["mean"]
         .sort_values(ascending=False)
         .head(15)
+        .rename(selected_skill)
         .reset_index()
     )
 
-    fig = px.bar(
-        skill_by_nation,
-        x="Nationality",
-        y=selected_skill,
-        color=selected_skill,
-        color_continuous_scale="Viridis",
-        title=f"Top 15 Nations by Average {selected_skill} Rating",
-    )
+    bar_trace = {
+        "type": "bar",
+        "x": skill_by_nation["Nationality"].tolist(),
+        "y": typed_array(skill_by_nation[selected_skill].to_numpy()),
+        "marker": {
+            "color": typed_array(skill_by_nation[selected_skill].to_numpy()),
+            "coloraxis": "coloraxis",
+        },
+        "showlegend": False,
+        "hovertemplate": (
+            f"Nationality=%{{x}}<br>{selected_skill}=%{{marker.color}}"
+            "<extra></extra>"
+        ),
+    }
 
-    fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=20, r=20, t=60, b=20),
-        xaxis=dict(
-            title="Nationality",
-            tickangle=-45,
+    return make_figure(
+        [bar_trace],
+        figure_layout(
+            f"Top 15 Nations by Average {selected_skill} Rating",
+            xaxis=axis_layout("Nationality", tickangle=-45),
+            yaxis=axis_layout(f"Average {selected_skill} Rating"),
+            coloraxis={
+                "colorscale": COLORSCALES["Viridis"],
+                "colorbar": {"title": {"text": selected_skill}},
+                "showscale": True,
+            },
+            legend={"tracegroupgap": 0},
+            barmode="relative",
         ),
-        yaxis=dict(title=f"Average {selected_skill} Rating"),
-        coloraxis_showscale=True,
-        height=450,
     )
 
-    return fig
-
 
-@callback(
-    Output("radar-chart", "figure"),
-    [
-        Input("player1-dropdown", "value"),
-        Input("player2-dropdown", "value"),
-        Input("nationality-dropdown", "value"),
-    ],
-)
-def update_radar_chart(player1, player2, nationality):
+# The player values carry their nationality, so a nationality change reaches
+# the radar chart only through the new default players that
+# update_nation_dashboard writes, and the chart is computed once
+@timed("fifa_dash_callback_seconds", "update_radar_chart")
+def update_radar_chart(data, player1, player2):
     if not player1 or not player2:
         # Return empty figure if players not selected
-        return go.Figure()
-
-    # Filter data for the selected players
-    filtered_df = df[df["Nationality"] == nationality]
-    player1_data = filtered_df[filtered_df["Name"] == player1]
-    player2_data = filtered_df[filtered_df["Name"] == player2]
-
-    if player1_data.empty or player2_data.empty:
-        return go.Figure()
-
-    # Skills to compare
-    skills = [
-        "Ball control",
-        "Dribbling",
-        "Finishing",
-        "Acceleration",
-        "Aggression",
-        "Agility",
-        "Balance",
-        "Composure",
-        "Strength",
-        "Stamina",
-    ]
+        return make_figure([])
 
-    # Filter skills that exist in the dataframe
-    available_skills = [skill for skill in skills if skill in filtered_df.columns]
+    # Look up both players' skills, by the nationality and name in each value
+    player1_skills = data.player_skills(*split_player_key(player1))
+    player2_skills = data.player_skills(*split_player_key(player2))
 
-    # Extract values for each player
-    player1_values = player1_data[available_skills].iloc[0].values.tolist()
-    player2_values = player2_data[available_skills].iloc[0].values.tolist()
+    if player1_skills is None or player2_skills is None:
+        return make_figure([])
 
     # Create radar chart
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Scatterpolar(
-            r=player1_values, theta=available_skills, fill="toself", name=player1
-        )
-    )
-
-    fig.add_trace(
-        go.Scatterpolar(
-            r=player2_values, theta=available_skills, fill="toself", name=player2
-        )
-    )
+    label1 = player_option(player1)["label"]
+    label2 = player_option(player2)["label"]
+    traces = [
+        {
+            "type": "scatterpolar",
+            "r": typed_array(skills),
+            "theta": data.radar_skills,
+            "fill": "toself",
+            "name": label,
+        }
+        for label, skills in ((label1, player1_skills), (label2, player2_skills))
+    ]
 
-    fig.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-        title=f"Skill Comparison: {player1} vs {player2}",
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=40, r=40, t=60, b=40),
-        height=500,
+    return make_figure(
+        traces,
+        figure_layout(
+            f"Skill Comparison: {label1} vs {label2}",
+            polar={"radialaxis": {"visible": True, "range": [0, 100]}},
+            margin={"l": 40, "r": 40, "t": 60, "b": 40},
+            height=500,
+        ),
     )
 
-    return fig
 
-
-@callback(
-    Output("club-performance-chart", "figure"),
-    [Input("club-metric-radio", "value"), Input("nationality-dropdown", "value")],
-)
-def update_club_chart(selected_metric, nationality):
-    # Filter data by nationality
-    filtered_df = df[df["Nationality"] == nationality].copy()
-
-    # Group by club and calculate average for the selected metric
-    club_stats = (
-        filtered_df.groupby("Club")[selected_metric]
-        .agg(["mean", "count"])
-        .reset_index()
-    )
+@timed("fifa_dash_callback_seconds", "update_club_chart")
+def update_club_chart(data, selected_metric, nationality):
+    # Average metric per club for this nationality, read from the aggregate cube
+    nation_club_stats = data.aggregate_cube.stats("nationality_club", selected_metric)
+    if nationality in nation_club_stats.index.get_level_values("Nationality"):
+        club_stats = nation_club_stats.xs(nationality, level="Nationality")
+    else:
+        club_stats = nation_club_stats.iloc[0:0].droplevel("Nationality")
+    club_stats = club_stats[["mean", "count"]].reset_index()
 
     # Sort by mean value and filter for clubs with at least 2 players
     club_stats = (
@@ -758,38 +2360,344 @@ def update_club_chart(selected_metric, nationality):
         .head(10)
     )
 
-    fig = px.bar(
-        club_stats,
-        x="Club",
-        y="mean",
-        color="mean",
-        color_continuous_scale="Bluered",
-        title=f"Top 10 Clubs by Average {selected_metric} - {nationality} Players",
-        text="count",
-    )
+    bar_trace = {
+        "type": "bar",
+        "x": club_stats["Club"].tolist(),
+        "y": typed_array(club_stats["mean"].to_numpy()),
+        "text": typed_array(club_stats["count"].to_numpy()),
+        "texttemplate": "%{text} players",
+        "textposition": "outside",
+        "marker": {
+            "color": typed_array(club_stats["mean"].to_numpy()),
+            "coloraxis": "coloraxis",
+        },
+        "showlegend": False,
+        "hovertemplate": (
+            "Club=%{x}<br>mean=%{marker.color}<br>count=%{text}<extra></extra>"
+        ),
+    }
 
-    fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        margin=dict(l=20, r=20, t=60, b=20),
-        xaxis=dict(
-            title="Club",
-            tickangle=-45,
+    return make_figure(
+        [bar_trace],
+        figure_layout(
+            f"Top 10 Clubs by Average {selected_metric} - {nationality} Players",
+            xaxis=axis_layout("Club", tickangle=-45),
+            yaxis=axis_layout(f"Average {selected_metric}"),
+            coloraxis={
+                "colorscale": COLORSCALES["Bluered"],
+                "colorbar": {"title": {"text": "mean"}},
+                "showscale": True,
+            },
+            legend={"tracegroupgap": 0},
+            barmode="relative",
         ),
-        yaxis=dict(title=f"Average {selected_metric}"),
-        coloraxis_showscale=True,
-        height=450,
     )
 
-    # Add text about number of players
-    fig.update_traces(
-        texttemplate="%{text} players",
-        textposition="outside",
+
+# Startup warm-up of the figure caches: "0" disables it, a number N warms the
+# N nationalities with the most players, and a comma-separated list names the
+# nationalities to warm. Each is built for every skill-radio value.
+WARM_UP = os.environ.get("FIFA_WARM_UP", "0")
+WARM_UP_THREADS = int(os.environ.get("FIFA_WARM_UP_THREADS", "4"))
+
+
+def get_warm_up_nations(data, setting):
+    """Return the nationalities selected by a FIFA_WARM_UP setting."""
+    setting = setting.strip()
+    if setting.isdigit():
+        by_size = sorted(data.nation_sizes, key=data.nation_sizes.get, reverse=True)
+        return by_size[: int(setting)]
+    nationalities = [nat.strip() for nat in setting.split(",") if nat.strip()]
+    unknown = [nat for nat in nationalities if nat not in data.nation_sizes]
+    if unknown:
+        logger.warning("Skipping unknown warm-up nationalities: %s", unknown)
+    return [nat for nat in nationalities if nat in data.nation_sizes]
+
+
+def warm_up_views(data, nationalities, threads=WARM_UP_THREADS):
+    """Build the cached dashboard views of ``nationalities`` in a thread pool.
+
+    Fills the cached_nation_dashboard cache for each nationality and the
+    cached_skill_dashboard cache for each (nationality, skill) pair. A view
+    that fails to build is logged and left to be built on request.
+    """
+    skills = [option["value"] for option in skill_radio_options]
+    views = len(nationalities) * (1 + len(skills))
+    if len(nationalities) * len(skills) > FIGURE_CACHE_SIZE:
+        logger.warning(
+            "Warming up %d skill views, more than FIFA_FIGURE_CACHE_SIZE=%d keeps",
+            len(nationalities) * len(skills),
+            FIGURE_CACHE_SIZE,
+        )
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = {
+            pool.submit(cached_nation_dashboard, data.generation, nat): nat
+            for nat in nationalities
+        }
+        futures.update(
+            {
+                pool.submit(
+                    cached_skill_dashboard, data.generation, nat, skill
+                ): f"{nat}/{skill}"
+                for nat in nationalities
+                for skill in skills
+            }
+        )
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception() is not None:
+                logger.warning(
+                    "Warm-up of %s failed: %s", futures[future], future.exception()
+                )
+    logger.info(
+        "Warmed up %d views of %d nationalities in %.2fs",
+        views,
+        len(nationalities),
+        time.perf_counter() - start,
     )
 
-    return fig
+
+def publish_dashboard_data(dash_app, data, warm_up=WARM_UP):
+    """Make ``data`` the dataset every callback of ``dash_app`` reads.
+
+    The swap is a single assignment, so callbacks see either the old or the
+    new data, never a mix. Cached figures of the old data are dropped, then
+    the views selected by ``warm_up`` (see WARM_UP) are built for the new one.
+    """
+    dash_app.dashboard_data = data
+    cached_nation_dashboard.cache_clear()
+    cached_skill_dashboard.cache_clear()
+    nationalities = get_warm_up_nations(data, warm_up)
+    if nationalities:
+        warm_up_views(data, nationalities)
+
+
+# Hot reload: with FIFA_RELOAD_INTERVAL set to a number of seconds, each
+# process checks the dataset file that often and swaps in the new data when
+# its contents change. 0 disables reloading.
+RELOAD_INTERVAL = float(os.environ.get("FIFA_RELOAD_INTERVAL", "0"))
+
+
+class DatasetReloader:
+    """Background thread that reloads the dataset when the file changes.
+
+    The file's size and mtime are polled. A change is only acted on once they
+    are the same on two polls in a row, so a file still being written is not
+    read, and a reload happens only if the contents hash differs from the
+    loaded one. The new DashboardData is fully built in this thread before
+    publish_dashboard_data swaps it into ``dash_app``. A failed reload is
+    logged and the current data is kept; the file is tried again once it has
+    settled on the next polls.
+    """
+
+    def __init__(
+        self, dash_app, path, compact=False, warm_up=WARM_UP, interval=RELOAD_INTERVAL
+    ):
+        self.dash_app = dash_app
+        self.path = path
+        self.compact = compact
+        self.warm_up = warm_up
+        self.interval = interval
+        self._source = self._stat()
+        self._pending = None
+        self._digest = self._cached_digest()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _cached_digest(self):
+        # load_dataset records the hash of the CSV it prepared, so the loaded
+        # contents need not be hashed again when the recorded file is current
+        try:
+            with open(get_cache_paths(self.path)[1]) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta.get("sha256") if meta.get("source") == self._source else None
+
+    def start(self):
+        """Start polling in a thread of this process, unless already started."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="dataset-reloader", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Dataset reload of %s failed", self.path)
+
+    def check(self):
+        """Reload the dataset if the file changed and has settled."""
+        source = self._stat()
+        if source is None or source == self._source:
+            self._pending = None
+            return False
+        if source != self._pending:
+            self._pending = source
+            return False
+
+        # The settled source is only recorded once it has been handled, so a
+        # load that fails is retried on later polls
+        self._pending = None
+        digest = get_file_digest(self.path)
+        if digest == self._digest:
+            self._source = source
+            return False
+
+        start = time.perf_counter()
+        data = load_dashboard_data(self.path, compact=self.compact)
+        publish_dashboard_data(self.dash_app, data, self.warm_up)
+        self._source, self._digest = source, digest
+        logger.info(
+            "Reloaded %s (%d players) in %.2fs",
+            self.path,
+            sum(data.nation_sizes.values()),
+            time.perf_counter() - start,
+        )
+        return True
+
+
+def start_dataset_reloader(dash_app):
+    """Start watching ``dash_app``'s dataset file if FIFA_RELOAD_INTERVAL is set.
+
+    Threads do not survive a fork, so under Gunicorn every worker starts its
+    own reloader thread (see post_fork in gunicorn.conf.py).
+    """
+    if dash_app.dataset_reloader is not None:
+        dash_app.dataset_reloader.start()
+    return dash_app.dataset_reloader
+
+
+def register_callbacks(dash_app):
+    """Register the dashboard callbacks on ``dash_app``.
+
+    Each callback reads the app's current data once when it starts and passes
+    it to the update function, so a request keeps one consistent snapshot even
+    if a reload lands mid-request.
+    """
+
+    def bind(func):
+        def run(*args):
+            return func(dash_app.dashboard_data, *args)
+
+        return run
+
+    dash_app.callback(
+        [
+            Output("position-pie-chart", "figure"),
+            Output("player1-dropdown", "value"),
+            Output("player2-dropdown", "value"),
+            Output("age-distribution", "figure"),
+            Output("potential-vs-age", "figure"),
+            Output("correlation-heatmap", "figure"),
+        ],
+        Input("nationality-dropdown", "value"),
+    )(bind(update_nation_dashboard))
+    for dropdown_id in ("player1-dropdown", "player2-dropdown"):
+        dash_app.callback(
+            Output(dropdown_id, "options"),
+            [Input(dropdown_id, "search_value"), Input(dropdown_id, "value")],
+        )(bind(update_player_options))
+    dash_app.callback(
+        Output("top-players-graph", "figure"),
+        [Input("nationality-dropdown", "value"), Input("skill-radio", "value")],
+    )(bind(update_skill_dashboard))
+    dash_app.callback(
+        [
+            Output("players-table", "data"),
+            Output("players-table", "columns"),
+            Output("players-table", "page_count"),
+            Output("players-table", "page_current"),
+        ],
+        [
+            Input("nationality-dropdown", "value"),
+            Input("skill-radio", "value"),
+            Input("players-table", "page_current"),
+            Input("players-table", "page_size"),
+            Input("players-table", "sort_by"),
+            Input("players-table", "filter_query"),
+        ],
+    )(bind(update_players_table))
+    dash_app.callback(
+        Output("overall-skill-chart", "figure"),
+        Input("overall-skill-radio", "value"),
+    )(bind(update_overall_chart))
+    dash_app.callback(
+        Output("radar-chart", "figure"),
+        [Input("player1-dropdown", "value"), Input("player2-dropdown", "value")],
+    )(bind(update_radar_chart))
+    dash_app.callback(
+        Output("club-performance-chart", "figure"),
+        [Input("club-metric-radio", "value"), Input("nationality-dropdown", "value")],
+    )(bind(update_club_chart))
+
+
+def create_app(path=file_name, compact=COMPACT_LOAD, warm_up=WARM_UP):
+    """Load and prepare the dataset, then build a Dash app around it.
+
+    Every app has its own data, callbacks and dataset reloader (started with
+    start_dataset_reloader). The figure caches are warmed up according to
+    ``warm_up`` (see WARM_UP) before the app is returned, so before it serves
+    any request.
+    """
+    dash_app = Dash(__name__, suppress_callback_exceptions=True)
+    publish_dashboard_data(
+        dash_app, load_dashboard_data(path, compact=compact), warm_up
+    )
+    dash_app.dataset_reloader = (
+        DatasetReloader(dash_app, path, compact, warm_up)
+        if RELOAD_INTERVAL > 0
+        else None
+    )
+    dash_app.layout = lambda: serve_layout(dash_app.dashboard_data)
+    register_callbacks(dash_app)
+
+    # Instrumentation
+    dash_app.server.before_request(start_request_timer)
+    dash_app.server.after_request(record_callback_response)
+    # Registered last so it runs first, and the response metrics see both sizes
+    dash_app.server.after_request(compress_response)
+    dash_app.server.add_url_rule("/metrics", "metrics", serve_metrics)
+
+    # Lets the Gunicorn worker hooks find the app behind its WSGI server
+    dash_app.server.extensions["fifa_dashboard"] = dash_app
+    return dash_app
+
+
+def create_server(path=file_name, compact=COMPACT_LOAD, warm_up=WARM_UP):
+    """Return the WSGI server of a new app; the Gunicorn entry point.
+
+    Under "gunicorn --preload" (see gunicorn.conf.py) this runs once in the
+    master process, and the workers forked from it share the prepared dataset
+    copy-on-write. Freezing the garbage collector keeps it from touching those
+    objects and unsharing their memory pages.
+    """
+    server = create_app(path, compact, warm_up).server
+    gc.freeze()
+    return server
 
 
 # Run the app
 if __name__ == "__main__":
-    app.run(debug=True, port=8051)
+    logging.basicConfig(level=logging.INFO)
+    app = create_app()
+    start_dataset_reloader(app)
+    app.run(
+        debug=os.environ.get("FIFA_DASH_DEBUG", "0") == "1",
+        port=int(os.environ.get("PORT", "8051")),
+    )
@@ -0,0 +1,256 @@
+# Generate synthetic FIFA 2018 shaped datasets for scaling tests.
+#
+#     python Fifa2018_Synthetic_Data.py --rows 100000 --output fifa_100k.csv
+#
+# The output has the same columns as Fifa2018_dataset.csv. Nationalities and
+# clubs follow a Zipf-like skew, most players of a club share its home nation,
+# and a share of the attribute ratings use the "81+2" / "70-1" notation of the
+# real export.
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Largest nations in the 2018 export, most common first
+TOP_NATIONS = [
+    "England",
+    "Germany",
+    "Spain",
+    "France",
+    "Argentina",
+    "Brazil",
+    "Italy",
+    "Colombia",
+    "Japan",
+    "Netherlands",
+    "Republic of Ireland",
+    "Chile",
+    "Sweden",
+    "China PR",
+    "Mexico",
+    "Norway",
+    "Saudi Arabia",
+    "United States",
+    "Denmark",
+    "Poland",
+    "Korea Republic",
+    "Portugal",
+    "Turkey",
+    "Belgium",
+    "Scotland",
+    "Australia",
+    "Switzerland",
+    "Austria",
+    "Uruguay",
+    "Senegal",
+]
+
+POSITIONS = [
+    "ST",
+    "CF",
+    "LW",
+    "RW",
+    "CAM",
+    "LM",
+    "RM",
+    "CM",
+    "CDM",
+    "LWB",
+    "RWB",
+    "LB",
+    "RB",
+    "CB",
+    "GK",
+]
+
+# Rating columns of the real export, in its column order
+ATTRIBUTE_COLUMNS = [
+    "Acceleration",
+    "Aggression",
+    "Agility",
+    "Balance",
+    "Ball control",
+    "Composure",
+    "Crossing",
+    "Curve",
+    "Dribbling",
+    "Finishing",
+    "Free kick accuracy",
+    "GK diving",
+    "GK handling",
+    "GK kicking",
+    "GK positioning",
+    "GK reflexes",
+    "Heading accuracy",
+    "Interceptions",
+    "Jumping",
+    "Long passing",
+    "Long shots",
+    "Marking",
+    "Penalties",
+    "Positioning",
+    "Reactions",
+    "Short passing",
+    "Shot power",
+    "Sliding tackle",
+    "Sprint speed",
+    "Stamina",
+    "Standing tackle",
+    "Strength",
+    "Vision",
+    "Volleys",
+]
+
+POSITION_RATING_COLUMNS = [
+    "CAM",
+    "CB",
+    "CDM",
+    "CF",
+    "CM",
+    "LAM",
+    "LB",
+    "LCB",
+    "LCM",
+    "LDM",
+    "LF",
+    "LM",
+    "LS",
+    "LW",
+    "LWB",
+    "RAM",
+    "RB",
+    "RCB",
+    "RCM",
+    "RDM",
+    "RF",
+    "RM",
+    "RS",
+    "RW",
+    "RWB",
+    "ST",
+]
+
+
+def zipf_weights(count, exponent):
+    """Return normalized Zipf weights for ``count`` ranked items."""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return weights / weights.sum()
+
+
+def with_deltas(rng, values, share):
+    """Render ratings as strings, writing ``share`` of them as "base+delta"."""
+    text = values.astype(str).astype(object)
+    rows = np.flatnonzero(rng.random(len(values)) < share)
+    deltas = rng.choice([-3, -2, -1, 1, 2, 3], len(rows))
+    bases = np.clip(values[rows] - deltas, 1, 99)
+    signs = np.where(deltas < 0, "-", "+")
+    text[rows] = (
+        pd.Series(bases.astype(str))
+        + pd.Series(signs)
+        + pd.Series(np.abs(deltas).astype(str))
+    ).to_numpy()
+    return text
+
+
+def generate_dataset(rows, seed=0, delta_share=0.05):
+    """Return a synthetic dataset with the columns of the FIFA 2018 export."""
+    rng = np.random.default_rng(seed)
+
+    # Nations and clubs scale with the dataset, both with a long tail
+    nation_count = max(len(TOP_NATIONS), min(220, rows // 80))
+    nations = np.array(
+        TOP_NATIONS + [f"Nation {i}" for i in range(nation_count - len(TOP_NATIONS))],
+        dtype=object,
+    )
+    club_count = max(20, rows // 28)
+    clubs = np.array([f"Club {i}" for i in range(club_count)], dtype=object)
+    club_nations = rng.choice(
+        nation_count, club_count, p=zipf_weights(nation_count, 1.1)
+    )
+
+    # Most players share their club's home nation; the rest are drawn from the
+    # skewed nation distribution
+    club = rng.choice(club_count, rows, p=zipf_weights(club_count, 0.1))
+    nation = np.where(
+        rng.random(rows) < 0.6,
+        club_nations[club],
+        rng.choice(nation_count, rows, p=zipf_weights(nation_count, 1.0)),
+    )
+
+    age = np.clip(np.round(rng.normal(25, 4.5, rows)), 16, 45).astype(int)
+    overall = np.clip(np.round(rng.normal(66, 7, rows)), 40, 94).astype(int)
+    potential = np.clip(
+        overall + np.maximum(0, np.round((28 - age) * rng.uniform(0.5, 1.5, rows))),
+        overall,
+        95,
+    ).astype(int)
+
+    ids = np.arange(rows)
+    frame = pd.DataFrame(
+        {
+            "Unnamed: 0": ids,
+            "Name": pd.Series(rng.choice(list("ABCDEFGHIJKLMNOPRSTVW"), rows))
+            + ". Player"
+            + pd.Series(rng.integers(0, max(1, rows // 2), rows).astype(str)),
+            "Age": age,
+            "Photo": "https://cdn.sofifa.org/48/18/players/"
+            + pd.Series(ids).astype(str)
+            + ".png",
+            "Nationality": nations[nation],
+            "Flag": "https://cdn.sofifa.org/flags/"
+            + pd.Series(nation).astype(str)
+            + ".png",
+            "Overall": overall,
+            "Potential": potential,
+            "Club": clubs[club],
+            "Club Logo": "https://cdn.sofifa.org/24/18/teams/"
+            + pd.Series(club).astype(str)
+            + ".png",
+            "Value": "€" + pd.Series(np.round(overall**3 / 3e4, 1)).astype(str) + "M",
+            "Wage": "€" + pd.Series(overall * 3).astype(str) + "K",
+            "Special": overall * 30 + rng.integers(-200, 200, rows),
+        }
+    )
+
+    for col in ATTRIBUTE_COLUMNS:
+        values = np.clip(np.round(overall + rng.normal(-5, 12, rows)), 5, 99)
+        frame[col] = with_deltas(rng, values.astype(int), delta_share)
+
+    for col in POSITION_RATING_COLUMNS:
+        frame[col] = np.clip(overall + rng.integers(-15, 3, rows), 20, 99).astype(float)
+
+    # One to three distinct positions per player, space separated with the
+    # trailing space of the real export
+    first = rng.choice(len(POSITIONS), rows)
+    second = (first + rng.integers(1, len(POSITIONS), rows)) % len(POSITIONS)
+    counts = rng.choice([1, 2, 3], rows, p=[0.45, 0.4, 0.15])
+    positions = np.array(POSITIONS, dtype=object)
+    preferred = positions[first] + " "
+    preferred = np.where(counts > 1, preferred + positions[second] + " ", preferred)
+    third = (second + 1) % len(POSITIONS)
+    third = np.where(third == first, (third + 1) % len(POSITIONS), third)
+    preferred = np.where(counts > 2, preferred + positions[third] + " ", preferred)
+    frame["Preferred Positions"] = preferred
+
+    # Goalkeepers have no outfield position ratings in the export
+    goalkeepers = first == POSITIONS.index("GK")
+    frame.loc[goalkeepers, POSITION_RATING_COLUMNS] = np.nan
+
+    return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic FIFA 2018 shaped dataset."
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="Fifa2018_synthetic.csv")
+    args = parser.parse_args()
+
+    generate_dataset(args.rows, seed=args.seed).to_csv(args.output, index=False)
+    print(f"Wrote {args.rows} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# Gunicorn settings for serving the dashboard in production:
+#
+#     gunicorn -c gunicorn.conf.py
+#
+# The app is created once in the master process (preload_app) by the
+# create_server() factory, so the dataset is loaded and prepared a single time
+# and the forked workers share it copy-on-write instead of each holding a
+# private copy. With FIFA_RELOAD_INTERVAL set, each worker watches the dataset
+# file itself and builds its own copy of a changed dataset.
+import logging
+import multiprocessing
+import os
+
+logging.basicConfig(level=logging.INFO)
+
+wsgi_app = "Fifa2018_Dash_App:create_server()"
+preload_app = True
+bind = os.environ.get("FIFA_BIND", "0.0.0.0:8051")
+workers = int(os.environ.get("FIFA_WORKERS", str(multiprocessing.cpu_count() * 2 + 1)))
+threads = int(os.environ.get("FIFA_THREADS", "1"))
+
+
+def post_fork(server, worker):
+    # The dataset reloader thread is not inherited from the master
+    from Fifa2018_Dash_App import start_dataset_reloader
+
+    start_dataset_reloader(server.app.wsgi().extensions["fifa_dashboard"])
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Fifa2018_Synthetic_Data import generate_dataset  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def dataset_path(tmp_path_factory):
+    """Write a small synthetic FIFA 2018 export and return its path."""
+    path = tmp_path_factory.mktemp("data") / "fifa_synthetic.csv"
+    generate_dataset(2000, seed=1).to_csv(path, index=False)
+    return str(path)
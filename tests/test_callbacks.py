@@ -0,0 +1,94 @@
+import pytest
+
+from Fifa2018_Dash_App import create_app
+
+
+@pytest.fixture(scope="module")
+def client(dataset_path):
+    return create_app(dataset_path, warm_up="0").server.test_client()
+
+
+def parse_outputs(output):
+    """Split a callback's output spec into (component id, property) pairs."""
+    specs = output.strip(".").split("...") if output.startswith("..") else [output]
+    return [tuple(spec.rsplit(".", 1)) for spec in specs]
+
+
+def layout_props(node, props):
+    """Collect the properties of every component with an id in a layout."""
+    if isinstance(node, list):
+        for child in node:
+            layout_props(child, props)
+    elif isinstance(node, dict) and "props" in node:
+        if "id" in node["props"]:
+            for name, value in node["props"].items():
+                props[(node["props"]["id"], name)] = value
+        layout_props(node["props"].get("children"), props)
+    return props
+
+
+def run_user_action(client, props, changed):
+    """Propagate a property change through the callback graph.
+
+    Like the Dash renderer, callbacks fire in waves: every callback with an
+    input changed in one wave runs once in the next. Returns the number of
+    invocations of each callback, keyed by its output spec.
+    """
+    dependencies = client.get("/_dash-dependencies").get_json()
+    calls = {}
+    while changed:
+        fired = [
+            dep
+            for dep in dependencies
+            if any((i["id"], i["property"]) in changed for i in dep["inputs"])
+        ]
+        changed = set()
+        for dep in fired:
+            calls[dep["output"]] = calls.get(dep["output"], 0) + 1
+            outputs = [
+                {"id": component, "property": name}
+                for component, name in parse_outputs(dep["output"])
+            ]
+            response = client.post(
+                "/_dash-update-component",
+                json={
+                    "output": dep["output"],
+                    # Single-output callbacks take the output itself
+                    "outputs": outputs if len(outputs) > 1 else outputs[0],
+                    "inputs": [
+                        {**i, "value": props.get((i["id"], i["property"]))}
+                        for i in dep["inputs"]
+                    ],
+                    "changedPropIds": [
+                        f"{i['id']}.{i['property']}" for i in dep["inputs"]
+                    ],
+                    "state": [],
+                },
+            )
+            assert response.status_code in (200, 204), response.data
+            if response.status_code == 204:
+                continue
+            for component, values in response.get_json()["response"].items():
+                for name, value in values.items():
+                    if props.get((component, name)) != value:
+                        props[(component, name)] = value
+                        changed.add((component, name))
+    return calls
+
+
+def test_nationality_change_computes_radar_once(client):
+    props = layout_props(client.get("/_dash-layout").get_json(), {})
+    current = props[("nationality-dropdown", "value")]
+    other = next(
+        option["value"]
+        for option in props[("nationality-dropdown", "options")]
+        if option["value"] != current
+    )
+    props[("nationality-dropdown", "value")] = other
+
+    calls = run_user_action(client, props, {("nationality-dropdown", "value")})
+
+    assert calls["radar-chart.figure"] == 1
+    assert calls["top-players-graph.figure"] == 1
+    assert calls["club-performance-chart.figure"] == 1
+    assert sum(calls.values()) == 7
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from Fifa2018_Dash_App import build_position_counts, make_binned_age_histogram
+
+
+def test_age_histogram_groups_by_position():
+    players = pd.DataFrame(
+        {
+            "Age": [20, 21, 30, np.nan, 25, 20],
+            "Preferred Positions": ["ST LW ", "GK ", "ST ", "CB ", "  ", "LW"],
+        }
+    )
+    figure = make_binned_age_histogram(players, "Nation")
+    bars = [trace for trace in figure["data"] if trace["type"] == "bar"]
+    boxes = [trace for trace in figure["data"] if trace["type"] == "box"]
+
+    # One bar and one box per listed position, most common first
+    assert [bar["name"] for bar in bars] == ["ST", "LW", "GK", "Unknown"]
+    assert [box["name"] for box in boxes] == ["ST", "LW", "GK", "Unknown"]
+    assert sum(len(bar["x"]["bdata"]) > 0 for bar in bars) == 4
+    assert boxes[0]["median"] == [25.0]
+
+
+def test_age_histogram_size_is_bounded_by_positions(dataset_path):
+    players = pd.read_csv(dataset_path)
+    positions = set(players["Preferred Positions"].str.split().explode())
+    assert players["Preferred Positions"].nunique() > len(positions)
+
+    figure = make_binned_age_histogram(players, "All")
+    assert len(figure["data"]) == 2 * len(positions)
+
+
+def test_position_pie_and_age_histogram_share_positions():
+    players = pd.DataFrame(
+        {
+            "Nationality": "Nation",
+            "Age": [20, 21, 30, 25, 20],
+            "Preferred Positions": ["ST LW ", "GK ", "ST ", "  ", None],
+        }
+    )
+    counts = build_position_counts(players).loc["Nation"]
+    assert counts.to_dict() == {"GK": 1, "LW": 1, "ST": 2, "Unknown": 2}
+
+    figure = make_binned_age_histogram(players, "Nation")
+    bars = [trace for trace in figure["data"] if trace["type"] == "bar"]
+    assert sorted(bar["name"] for bar in bars) == sorted(counts.index)
@@ -0,0 +1,56 @@
+import pytest
+
+from Fifa2018_Dash_App import Metrics, create_app
+
+
+@pytest.fixture(scope="module")
+def client(dataset_path):
+    return create_app(dataset_path, warm_up="0").server.test_client()
+
+
+def update(client, output, outputs, inputs):
+    return client.post(
+        "/_dash-update-component",
+        json={
+            "output": output,
+            "outputs": outputs,
+            "inputs": inputs,
+            "changedPropIds": [],
+            "state": [],
+        },
+    )
+
+
+def test_metrics_record_registered_callbacks_only(client):
+    response = update(
+        client,
+        "overall-skill-chart.figure",
+        {"id": "overall-skill-chart", "property": "figure"},
+        [{"id": "overall-skill-radio", "property": "value", "value": "Dribbling"}],
+    )
+    assert response.status_code == 200
+    response = update(
+        client,
+        'x"}0.figure',
+        {"id": 'x"}0', "property": "figure"},
+        [{"id": "overall-skill-radio", "property": "value", "value": "Dribbling"}],
+    )
+    assert response.status_code != 200
+
+    # Only the registered callback has a series
+    text = client.get("/metrics").get_data(as_text=True)
+    assert (
+        'fifa_dash_request_seconds_count{output="overall-skill-chart.figure"}' in text
+    )
+    assert "x" not in {
+        line.split('"')[1][0] for line in text.splitlines() if "{" in line
+    }
+
+
+def test_metrics_escape_label_values():
+    metrics = Metrics()
+    metrics.observe("fifa_dash_stage_seconds", 'a"b\\c\nd', 0.5)
+    assert (
+        'fifa_dash_stage_seconds_count{stage="a\\"b\\\\c\\nd"} 1'
+        in metrics.render().splitlines()
+    )
@@ -0,0 +1,41 @@
+import gc
+import os
+import weakref
+
+from Fifa2018_Dash_App import DashboardData, PartitionedDashboardData, load_dataset
+
+
+def test_partitioned_data_matches_in_memory_data(dataset_path, tmp_path):
+    data = PartitionedDashboardData(dataset_path, 500, directory=str(tmp_path))
+    reference = DashboardData(load_dataset(dataset_path))
+    nationality = max(data.nation_sizes, key=data.nation_sizes.get)
+
+    assert data.nation_sizes == reference.nation_sizes
+    assert (
+        data.nation_df(nationality)["Name"].tolist()
+        == reference.nation_df(nationality)["Name"].tolist()
+    )
+    for skill in ("Dribbling", "Finishing"):
+        assert (
+            data.skill_order(nationality, skill).tolist()
+            == reference.skill_order(nationality, skill).tolist()
+        )
+    assert len(data.skill_order("Nowhere", "Dribbling")) == 0
+
+
+def test_dropped_partitioned_data_removes_its_directory(dataset_path, tmp_path):
+    data = PartitionedDashboardData(dataset_path, 500, directory=str(tmp_path))
+    nationality = data.nationalities[0]
+    data.nation_df(nationality)
+    data.skill_order(nationality, "Dribbling")
+    directory = data.directory
+    alive = weakref.ref(data)
+
+    # Freed by reference counting alone, as under gc.freeze() in Gunicorn
+    gc.disable()
+    try:
+        del data
+        assert alive() is None
+        assert not os.path.exists(directory)
+    finally:
+        gc.enable()
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from Fifa2018_Dash_App import load_csv_dataset, parse_rating_column, skill_columns
+
+
+def test_parse_rating_column_mixed_types():
+    # pandas hands back ints and strings in one object column when the blocks
+    # of a large CSV are inferred differently
+    series = pd.Series([81, "81+2", "70-1", np.nan, " 5 ", 77.0, "x", None])
+    values, repaired = parse_rating_column(series)
+    assert repaired == 2
+    expected = [81, 83, 69, np.nan, 5, 77, np.nan, np.nan]
+    np.testing.assert_array_equal(values.to_numpy(dtype=float), expected)
+
+
+def test_parse_rating_column_integral_result():
+    values, repaired = parse_rating_column(pd.Series(["60", "61+3", " 70 "]))
+    assert repaired == 1
+    assert values.dtype == np.int64
+    assert values.tolist() == [60, 64, 70]
+
+
+def test_load_csv_dataset_mixed_blocks(tmp_path):
+    # Enough integer rows that pandas infers the first block as int64 before
+    # it reaches the base+delta strings
+    rows = 300_000
+    dribbling = pd.Series(np.full(rows, 70), dtype=object)
+    dribbling.iloc[-3:] = ["81+2", "70-1", " 5 "]
+    frame = pd.DataFrame({"Name": "P", "Dribbling": dribbling})
+    path = tmp_path / "mixed.csv"
+    frame.to_csv(path, index=False)
+
+    loaded = load_csv_dataset(str(path))
+    assert loaded["Dribbling"].dtype == np.int64
+    assert loaded["Dribbling"].tail(3).tolist() == [83, 69, 5]
+
+
+def test_load_csv_dataset_numeric_ratings(dataset_path):
+    frame = load_csv_dataset(dataset_path)
+    for col in skill_columns:
+        assert pd.api.types.is_numeric_dtype(frame[col]), col
@@ -0,0 +1,43 @@
+import pandas as pd
+
+from Fifa2018_Dash_App import filter_table_rows, parse_filter_query
+
+frame = pd.DataFrame(
+    {
+        "Name": ["A. One", "B. Two", "C. Three", "D. Four"],
+        "Age": [22, 32, 19, 25],
+        "Club": ["Club 22", "Club 1", "FC Porto", "club 122"],
+    }
+)
+
+
+def names(filter_query):
+    return filter_table_rows(frame, filter_query)["Name"].tolist()
+
+
+def test_parse_filter_query_keeps_value_as_written():
+    assert parse_filter_query('{Club} contains 22 && {Name} s= "B. Two"') == [
+        ("Club", "contains", "22", 22.0, True),
+        ("Name", "eq", "B. Two", None, True),
+    ]
+
+
+def test_contains_numeric_looking_value_on_text_column():
+    assert names("{Club} contains 22") == ["A. One", "D. Four"]
+    assert names("{Club} icontains 1") == ["B. Two", "D. Four"]
+
+
+def test_contains_on_numeric_column():
+    assert names("{Age} contains 2") == ["A. One", "B. Two", "D. Four"]
+
+
+def test_comparison_on_text_column_uses_text():
+    assert names("{Club} s= Club 22") == ["A. One"]
+    assert names("{Club} i= CLUB 122") == ["D. Four"]
+    assert names("{Club} s!= Club 1") == ["A. One", "C. Three", "D. Four"]
+
+
+def test_comparison_on_numeric_column_uses_number():
+    assert names("{Age} s> 22 && {Club} icontains club") == ["B. Two", "D. Four"]
+    assert names("{Age} s= 19") == ["C. Three"]
+    assert names("{Age} s< young") == []